@@ -24,6 +24,7 @@ Configuration:
 """
 
 import sys
+import hmac
 import signal
 import argparse
 import logging
@@ -31,11 +32,22 @@ from pathlib import Path
 
 from src.config_loader import load_config
 from src.logger import setup_logging
-from src.futures_copy_trade_engine import FuturesCopyTradeEngine
 
 
 logger = logging.getLogger(__name__)
 
+SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# API key values shipped in config.example.yaml
+_PLACEHOLDER_KEYS = frozenset({
+    b'YOUR_MASTER_API_KEY',
+    b'YOUR_FOLLOWER1_API_KEY',
+    b'YOUR_FOLLOWER2_API_KEY',
+})
+
+# sigwait-style signal handling is POSIX-only; Windows keeps the handler path
+USE_SIGWAIT = hasattr(signal, 'sigtimedwait') and hasattr(signal, 'pthread_sigmask')
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -67,6 +79,15 @@ For more information, see README.md
     return parser.parse_args()
 
 
+def _is_placeholder_key(api_key):
+    """Check an API key against placeholders using constant-time comparison."""
+    key_bytes = api_key.encode('utf-8')
+    # Compare against every placeholder (no short-circuit) so timing doesn't
+    # depend on which placeholder, if any, matched
+    matches = [hmac.compare_digest(key_bytes, p) for p in _PLACEHOLDER_KEYS]
+    return any(matches)
+
+
 def validate_config(config):
     """
     Validate configuration before starting.
@@ -78,9 +99,7 @@ def validate_config(config):
         ValueError: If configuration is invalid
     """
     # Check for placeholder API keys
-    placeholder_keys = ['YOUR_MASTER_API_KEY', 'YOUR_FOLLOWER1_API_KEY', 'YOUR_FOLLOWER2_API_KEY']
-    
-    if config.master.api_key in placeholder_keys:
+    if _is_placeholder_key(config.master.api_key):
         raise ValueError(
             "Master API key is not configured. "
             "Please edit config.yaml and add your API credentials."
@@ -95,7 +114,7 @@ def validate_config(config):
         )
     
     for follower in enabled_followers:
-        if follower.api_key in placeholder_keys:
+        if _is_placeholder_key(follower.api_key):
             raise ValueError(
                 f"Follower '{follower.name}' API key is not configured. "
                 f"Please edit config.yaml and add API credentials."
@@ -116,6 +135,23 @@ def validate_config(config):
     logger.info(f"Configuration validated: {len(enabled_followers)} follower(s) enabled")
 
 
+def wait_for_shutdown(engine, poll_interval=1.0):
+    """
+    Block the main thread until a shutdown signal arrives or the engine stops.
+    
+    Args:
+        engine: Running copy trade engine
+        poll_interval: Seconds between checks that the engine is still running
+                       (it stops itself after too many reconnect failures)
+    """
+    while engine.is_running:
+        siginfo = signal.sigtimedwait(SHUTDOWN_SIGNALS, poll_interval)
+        if siginfo is not None:
+            logger.info(f"Received {signal.Signals(siginfo.si_signo).name}, shutting down...")
+            engine.stop()
+            return
+
+
 def print_banner():
     """Print welcome banner."""
     banner = """
@@ -132,7 +168,14 @@ def print_banner():
 
 def main():
     """Main entry point."""
+    if USE_SIGWAIT:
+        # Block shutdown signals before any thread starts (the log listener,
+        # the clients' time sync thread, the engine's workers) so every thread
+        # inherits the mask and they are only delivered to sigtimedwait()
+        signal.pthread_sigmask(signal.SIG_BLOCK, SHUTDOWN_SIGNALS)
+    
     args = parse_arguments()
+    engine = None
     
     try:
         # Load configuration
@@ -203,28 +246,37 @@ def main():
             logger.info("Using TESTNET environment (safe for testing)")
             logger.info("=" * 60)
         
+        # Import the trading stack (urllib3, websocket, ...) only once the
+        # config is known to be valid, keeping --help/--version and config
+        # errors fast
+        from src.futures_copy_trade_engine import FuturesCopyTradeEngine
+        
         # Initialize engine
         engine = FuturesCopyTradeEngine(config)
         
-        # Setup signal handlers for graceful shutdown
-        def signal_handler(sig, frame):
-            logger.info("\nReceived interrupt signal, shutting down...")
-            engine.stop()
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
         # Start engine
         logger.info("🚀 Starting futures copy trading engine...")
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
         
+        if not USE_SIGWAIT:
+            # Setup signal handlers for graceful shutdown
+            def signal_handler(sig, frame):
+                logger.info("\nReceived interrupt signal, shutting down...")
+                engine.stop()
+                sys.exit(0)
+            
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+        
         engine.start()
         
-        # Keep main thread alive
-        while engine.is_running:
-            signal.pause()
+        if USE_SIGWAIT:
+            wait_for_shutdown(engine)
+        else:
+            # Keep main thread alive
+            while engine.is_running:
+                signal.pause()
         
     except FileNotFoundError as e:
         print(f"\n❌ Error: {e}")
@@ -240,6 +292,8 @@ def main():
         
     except KeyboardInterrupt:
         logger.info("\nShutdown requested by user")
+        if engine is not None:
+            engine.stop()
         sys.exit(0)
         
     except Exception as e:
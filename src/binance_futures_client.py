@@ -1,27 +1,291 @@
 """Binance Futures API client for REST and WebSocket operations."""
 
+import os
+import math
+import socket
+import stat
 import time
 import hmac
 import hashlib
 import logging
-from typing import Dict, Optional, Any, List
+from typing import Deque, Dict, Optional, Any, List, NamedTuple, Set, Tuple
 from decimal import Decimal, ROUND_DOWN
-from threading import Lock
+from collections import deque
+from threading import Lock, Thread
 from enum import Enum
+from urllib.parse import urlencode
 
-import requests
+import urllib3
+
+# Optional HTTP/2 transport: concurrent follower orders multiplex over one
+# connection instead of one HTTP/1.1 connection each
+try:
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    import httpx
+except ImportError:
+    httpx = None
+
+# Fastest available JSON codec: orjson, then ujson, then stdlib json
+# (all three accept the raw response bytes directly)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+        
+        def _json_dumps(obj: Any) -> str:
+            return ujson.dumps(obj, ensure_ascii=False)
+    except ImportError:
+        import json
+        _json_loads = json.loads
+        
+        def _json_dumps(obj: Any) -> str:
+            return json.dumps(obj, separators=(',', ':'))
 
 from .rate_limiter import RateLimiter
 
 
 logger = logging.getLogger(__name__)
 
+# Exchange info is public and identical for every account, so symbol data is
+# cached per process (shared by master and follower clients), keyed by
+# (base_url, symbol) to keep testnet and production apart.
+_symbol_info_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_symbol_filters_cache: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+_warmed_base_urls: Set[str] = set()
+_symbol_precision_cache: Dict[Tuple[str, str], '_SymbolPrecision'] = {}
+
+# exchangeInfo rarely changes between restarts; reuse a disk copy for up to an hour.
+# Kept as JSON in a per-user (0700) cache directory, never in the shared tempdir.
+_SYMBOL_DISK_CACHE_TTL = 3600
+_SYMBOL_DISK_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'binance_copy_trading'
+)
+
+# Server time is re-synced in the background instead of on the order path
+_TIME_SYNC_INTERVAL = 300
+_TIME_SYNC_SAMPLES = 3  # offsets averaged to smooth out network jitter
+_TIME_NUDGE_MS = 1000
+
+# Transient gateway errors retried for idempotent (GET) requests only: a
+# POST that got one of these may still have been executed by Binance
+_RETRY_STATUSES = frozenset((502, 503, 504))
+_RETRY_STATUS_DELAY = 0.1  # seconds, doubled per attempt
+
+
+# Small order POSTs must not wait on Nagle, and idle pooled connections are
+# probed so a dead peer is noticed before the next order instead of on it
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux; macOS has no per-socket idle option here
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4),
+    ]
+
+
+# Every endpoint the client calls; full URLs are joined once per client
+_ENDPOINTS = (
+    '/fapi/v1/time',
+    '/fapi/v2/account',
+    '/fapi/v1/order',
+    '/fapi/v1/batchOrders',
+    '/fapi/v1/leverage',
+    '/fapi/v1/marginType',
+    '/fapi/v1/positionSide/dual',
+    '/fapi/v1/exchangeInfo',
+    '/fapi/v1/listenKey',
+    '/fapi/v1/ticker/price',
+    '/fapi/v1/premiumIndex',
+)
+
+# recvWindow leads so the static prefix spans a full 64-byte SHA-256 block,
+# which the cached per-prefix HMAC state then never re-hashes
+_ORDER_QUERY_PREFIX = "recvWindow=5000&symbol={}&side={}&type={}&positionSide={}"
+
+
+class _StepRule(NamedTuple):
+    """A step-size filter expressed in integer units of 10**-precision."""
+    precision: int
+    scale: int
+    step: int
+    min_units: int
+    max_units: int
+    frac_format: str  # format spec for the zero-padded fractional digits
+
+
+class _SymbolPrecision(NamedTuple):
+    """Per-symbol filter values, parsed once from LOT_SIZE/PRICE_FILTER/MIN_NOTIONAL."""
+    quantity: _StepRule
+    price: _StepRule
+    min_notional: Optional[Decimal]  # None when the symbol has no MIN_NOTIONAL filter
+
+
+class _AccountSnapshot(NamedTuple):
+    """Balances and positions indexed from a single account info response."""
+    balances: Dict[str, Decimal]
+    positions: Dict[str, List[Dict[str, Any]]]
+    fetched_at: float  # time.monotonic() of the fetch
+
+
+_DECIMAL_ZERO = Decimal('0')
+
+
+def _build_step_rule(step_size: str, min_value: str, max_value: str) -> _StepRule:
+    """Convert filter strings (e.g. LOT_SIZE stepSize/minQty/maxQty) to a _StepRule."""
+    step = Decimal(step_size)
+    precision = max(0, -step.as_tuple().exponent)
+    scale = 10 ** precision
+    return _StepRule(
+        precision=precision,
+        scale=scale,
+        step=int(step * scale),
+        min_units=math.ceil(Decimal(min_value) * scale),
+        max_units=math.floor(Decimal(max_value) * scale),
+        frac_format=f"0{precision}d"
+    )
+
+
+def _to_units(value: float, rule: _StepRule) -> int:
+    """
+    Convert a float to integer units of 10**-precision, rounding down.
+    
+    Works on the shortest repr of the float (like Decimal(str(value))), so
+    0.3 stays 0.3 instead of its binary approximation 0.29999...
+    """
+    text = repr(float(value))
+    if 'e' in text or text[0] == '-':
+        units = (Decimal(text) * rule.scale).to_integral_value(rounding=ROUND_DOWN)
+        return int(units)
+    whole, _, frac = text.partition('.')
+    units = int(whole) * rule.scale
+    if rule.precision:
+        units += int(frac[:rule.precision].ljust(rule.precision, '0'))
+    return units
+
+
+def _format_units(units: int, rule: _StepRule) -> str:
+    """
+    Format integer units as a fixed-precision decimal string (e.g. '0.010').
+    
+    Binance accepts values zero-padded to the filter's precision, so no
+    trailing-zero stripping is needed.
+    """
+    if rule.precision == 0:
+        return str(units)
+    whole, frac = divmod(units, rule.scale)
+    return f"{whole}.{format(frac, rule.frac_format)}"
+
+
+class _HttpResponse(NamedTuple):
+    """The urllib3 response fields _do_request reads, for other transports."""
+    status: int
+    reason: str
+    headers: Any
+    data: bytes
+
+
+class _Http2Pool:
+    """HTTP/2 httpx client behind the urllib3 PoolManager.request() interface."""
+    
+    def __init__(self) -> None:
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=0,  # retries are handled in _do_request
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                socket_options=_SOCKET_OPTIONS
+            )
+        )
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> _HttpResponse:
+        """Send a request; transport errors are raised as urllib3 HTTPError."""
+        try:
+            response = self.client.request(method, url, headers=headers, timeout=timeout)
+        except httpx.HTTPError as e:
+            raise urllib3.exceptions.HTTPError(str(e)) from e
+        return _HttpResponse(response.status_code, response.reason_phrase, response.headers, response.content)
+
+
+class _SharedHost:
+    """
+    Account-agnostic state for one base URL, shared by every client in the process.
+    
+    Holds the HTTP connection pool, the rate limiter (Binance request weight
+    is counted per IP, not per account) and the server time offset.
+    """
+    
+    def __init__(self) -> None:
+        self.http2 = httpx is not None
+        if self.http2:
+            self.http = _Http2Pool()
+        else:
+            # urllib3 pool directly: far shallower per-call stack than requests.Session.
+            # A single host is used, so keep few pools but enough keep-alive
+            # connections per pool that order bursts never drop a warm connection.
+            self.http = urllib3.PoolManager(
+                num_pools=4,
+                maxsize=32,
+                block=False,
+                headers={"Connection": "keep-alive"},
+                retries=False,  # retries are handled in _do_request
+                socket_options=_SOCKET_OPTIONS
+            )
+        # Rate limiting with weight tracking
+        self.rate_limiter = RateLimiter(
+            weight_limit=2400,  # Binance Futures: 2400 weight per minute
+            window_seconds=60,
+            safety_margin=0.8  # Use 80% of limit for safety
+        )
+        self.time_offset: Optional[int] = None  # None until first sync
+        self.time_samples: Deque[int] = deque(maxlen=_TIME_SYNC_SAMPLES)
+        # Sum of -1021 nudges, kept on top of the sample average by later syncs
+        # so a persistent skew the samples don't show stays corrected
+        self.time_correction = 0
+        # Bumped (under time_lock) whenever time_offset changes, so requests
+        # rejected together apply a single nudge
+        self.time_lock = Lock()
+        self.time_generation = 0
+        self.time_sync_thread: Optional[Thread] = None
+
+
+_shared_hosts: Dict[str, _SharedHost] = {}
+_shared_hosts_lock = Lock()
+
+
+def _get_shared_host(base_url: str) -> _SharedHost:
+    """Get or create the shared state for a base URL."""
+    with _shared_hosts_lock:
+        host = _shared_hosts.get(base_url)
+        if host is None:
+            host = _shared_hosts[base_url] = _SharedHost()
+        return host
+
 
 class BinanceAPIError(Exception):
     """Custom exception for Binance API errors."""
     pass
 
 
+class _TimestampError(BinanceAPIError):
+    """Request timestamp rejected by Binance (error -1021)."""
+    pass
+
+
 class PositionSide(Enum):
     """Position side for hedge mode."""
     BOTH = "BOTH"  # One-way mode
@@ -61,29 +325,46 @@ class BinanceFuturesClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret.encode('utf-8')
+        # Keyed once; copying it per request skips key setup and the pad XOR
+        # (a single C-level copy with the OpenSSL backend)
+        self._hmac_proto = hmac.new(self.api_secret, digestmod='sha256')
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update({"X-MBX-APIKEY": self.api_key})
+        # Connection pool, rate limiter and time offset are shared by all
+        # clients on this base URL; only the key and signer are per account
+        self._host = _get_shared_host(self.base_url)
+        self.http = self._host.http
+        self.rate_limiter = self._host.rate_limiter
+        self._headers = {"X-MBX-APIKEY": self.api_key}
+        if not self._host.http2:  # connection-specific headers are invalid in HTTP/2
+            self._headers["Connection"] = "keep-alive"
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _ENDPOINTS}
+        
+        # Time synchronization (once per base URL)
+        if self._host.time_offset is None:
+            self._sync_time()
+        self._start_time_sync_thread()
         
-        # Time synchronization
-        self.time_offset = 0
-        self._sync_time()
-        
-        # Rate limiting with weight tracking
-        self.rate_limiter = RateLimiter(
-            weight_limit=2400,  # Binance Futures: 2400 weight per minute
-            window_seconds=60,
-            safety_margin=0.8  # Use 80% of limit for safety
-        )
         self.request_lock = Lock()
-        self.last_request_time = 0
         self.min_request_interval = 0.05  # 50ms between requests
+        self._min_request_interval_ns = int(self.min_request_interval * 1e9)
+        self._next_request_ns = time.monotonic_ns()
         
         # Cache
-        self._symbol_info_cache: Dict[str, Dict[str, Any]] = {}
-        self._balance_cache: Dict[str, Decimal] = {}
-        self._balance_cache_time = 0
+        # Static order query prefixes with their pre-hashed HMAC state
+        self._order_prefix_cache: Dict[Tuple[str, str, str, PositionSide], Tuple[str, Any]] = {}
+        # One account info snapshot feeds both balance and position lookups
+        self._account_snapshot: Optional[_AccountSnapshot] = None
         self._balance_cache_ttl = 5  # 5 seconds TTL
+        self._position_cache_ttl = 2  # positions go stale faster than balances matter
+
+    @property
+    def time_offset(self) -> int:
+        """Server time minus local time in ms (shared per base URL)."""
+        return self._host.time_offset or 0
+
+    @time_offset.setter
+    def time_offset(self, value: int) -> None:
+        self._host.time_offset = value
 
     def _sync_time(self, retry_count: int = 3) -> None:
         """
@@ -97,11 +378,16 @@ class BinanceFuturesClient:
         """
         for attempt in range(retry_count):
             try:
-                response = self.session.get(f"{self.base_url}/fapi/v1/time", timeout=5)
-                response.raise_for_status()
-                server_time = response.json()['serverTime']
-                local_time = int(time.time() * 1000)
-                self.time_offset = server_time - local_time
+                response = self.http.request('GET', self._urls['/fapi/v1/time'], timeout=5)
+                if response.status >= 400:
+                    raise BinanceAPIError(f"HTTP error: {response.status} {response.reason}")
+                server_time = _json_loads(response.data)['serverTime']
+                local_time = time.time_ns() // 1_000_000
+                host = self._host
+                with host.time_lock:
+                    host.time_samples.append(server_time - local_time)
+                    host.time_offset = sum(host.time_samples) // len(host.time_samples) + host.time_correction
+                    host.time_generation += 1
                 logger.info(f"Time synchronized successfully. Offset: {self.time_offset}ms")
                 return
             except Exception as e:
@@ -111,83 +397,219 @@ class BinanceFuturesClient:
                 logger.warning(f"Time sync attempt {attempt + 1}/{retry_count} failed: {e}. Retrying...")
                 time.sleep(1)
     
+    def _start_time_sync_thread(self) -> None:
+        """Start the periodic time sync thread (one per base URL)."""
+        with _shared_hosts_lock:
+            if self._host.time_sync_thread is not None:
+                return
+            self._host.time_sync_thread = Thread(target=self._time_sync_loop, daemon=True)
+        self._host.time_sync_thread.start()
+    
+    def _time_sync_loop(self) -> None:
+        """Re-sync server time every _TIME_SYNC_INTERVAL seconds."""
+        while True:
+            time.sleep(_TIME_SYNC_INTERVAL)
+            try:
+                self._sync_time()
+            except Exception as e:
+                logger.warning(f"Periodic time sync failed, keeping offset {self.time_offset}ms: {e}")
+    
     def _get_timestamp(self) -> int:
         """Get current timestamp adjusted for server time offset."""
-        return int(time.time() * 1000) + self.time_offset
+        return time.time_ns() // 1_000_000 + self.time_offset
     
-    def _sign_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Sign request parameters with HMAC SHA256."""
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        signature = hmac.new(
-            self.api_secret,
-            query.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
-        params['signature'] = signature
-        return params
+    def _signature(self, payload: str, signed_prefix: Optional[Tuple[str, Any]] = None) -> str:
+        """
+        HMAC SHA256 hex signature of a payload with the account's API secret.
+        
+        Args:
+            payload: Data to sign
+            signed_prefix: (prefix, HMAC state that has absorbed it) for a
+                           payload starting with that prefix; only the rest
+                           is hashed
+        """
+        if signed_prefix is None:
+            mac = self._hmac_proto.copy()
+            mac.update(payload.encode("ascii"))
+        else:
+            prefix, prefix_mac = signed_prefix
+            mac = prefix_mac.copy()
+            mac.update(payload[len(prefix):].encode("ascii"))
+        return mac.hexdigest()
+
+    def _sign_query(self, query: str, signed_prefix: Optional[Tuple[str, Any]] = None) -> str:
+        """
+        Sign an encoded query string with HMAC SHA256.
+        
+        Args:
+            query: URL-encoded query string
+            signed_prefix: Optional pre-hashed query prefix (see _signature)
+            
+        Returns:
+            Query string with the signature appended
+        """
+        return f"{query}&signature={self._signature(query, signed_prefix)}"
+
+    def _get_url(self, endpoint: str) -> str:
+        """Full URL for an endpoint path (prebuilt for the known endpoints)."""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self.base_url + endpoint
+        return url
 
-    def _request(self, method: str, endpoint: str, signed: bool = False, weight: int = 1, **kwargs) -> Dict[str, Any]:
+    def _request_public(
+        self,
+        method: str,
+        endpoint: str,
+        weight: int = 1,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
-        Make HTTP request to Binance Futures API with rate limiting.
+        Make an unsigned request to Binance Futures API.
         
         Args:
             method: HTTP method
             endpoint: API endpoint
-            signed: Whether to sign the request
             weight: API weight of this request (default: 1)
-            **kwargs: Additional request parameters
+            params: Query parameters
             
         Returns:
             JSON response
         """
-        url = f"{self.base_url}{endpoint}"
+        url = self._get_url(endpoint)
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        return self._do_request(method, url, weight)
+
+    def _request_signed(
+        self,
+        method: str,
+        endpoint: str,
+        weight: int = 1,
+        params: Optional[Dict[str, Any]] = None,
+        query: Optional[str] = None,
+        signed_prefix: Optional[Tuple[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make a signed (timestamp + HMAC SHA256) request to Binance Futures API.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            weight: API weight of this request (default: 1)
+            params: Request parameters to sign
+            query: Pre-encoded query string, used instead of params on hot
+                   paths with a fixed parameter shape (must set recvWindow,
+                   must not set timestamp)
+            signed_prefix: (prefix, HMAC state that has absorbed it) for a
+                           query starting with that prefix
+            
+        Returns:
+            JSON response
+        """
+        if query is None:
+            params = dict(params) if params else {}
+            recv_window_suffix = f"&recvWindow={params.pop('recvWindow', 5000)}"
+            query = urlencode(params)
+        else:
+            recv_window_suffix = ""  # pre-encoded queries carry their own recvWindow
+        
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            time_generation = self._host.time_generation
+            auth = f"timestamp={self._get_timestamp()}{recv_window_suffix}"
+            signed_query = f"{query}&{auth}" if query else auth
+            # Send the exact signed query string so the signature covers the bytes sent
+            url = f"{self._get_url(endpoint)}?{self._sign_query(signed_query, signed_prefix)}"
+            try:
+                return self._do_request(method, url, weight)
+            except _TimestampError as e:
+                if attempt == max_retries - 1:
+                    logger.error(str(e))
+                    raise
+                self._recover_from_timestamp_error(e, time_generation, first_attempt=attempt == 0)
+
+    def _recover_from_timestamp_error(
+        self,
+        error: _TimestampError,
+        time_generation: int,
+        first_attempt: bool
+    ) -> None:
+        """
+        Correct the time offset after a -1021 rejection, before the retry.
+        
+        Args:
+            error: The rejection
+            time_generation: host.time_generation when the request was signed
+            first_attempt: Whether this was the request's first rejection
+        """
+        if first_attempt and 'ahead' in str(error):
+            # Clock ran ahead of the server: nudge the offset instead
+            # of paying a time sync round-trip before the retry. Only
+            # the first request rejected at this offset nudges it;
+            # the others just retry with the already nudged offset.
+            host = self._host
+            with host.time_lock:
+                if host.time_generation == time_generation:
+                    logger.warning(f"Timestamp ahead of server time, nudging offset by -{_TIME_NUDGE_MS}ms")
+                    host.time_correction -= _TIME_NUDGE_MS
+                    host.time_offset = self.time_offset - _TIME_NUDGE_MS
+                    host.time_generation += 1
+        else:
+            logger.warning("Timestamp out of sync, re-syncing...")
+            # Older samples (and nudges based on them) are what drifted;
+            # start over from a fresh measurement
+            with self._host.time_lock:
+                self._host.time_samples.clear()
+                self._host.time_correction = 0
+            self._sync_time()
+
+    def _reserve_request_slot(self) -> int:
+        """
+        Claim the next send slot for minimum request spacing.
         
-        if signed:
-            params = kwargs.get('params', {})
-            params['timestamp'] = self._get_timestamp()
-            if 'recvWindow' not in params:
-                params['recvWindow'] = 5000
-            params = self._sign_params(params)
-            kwargs['params'] = params
+        The lock only guards the integer compare-and-advance; callers sleep
+        for the returned delay after it is released.
         
+        Returns:
+            Nanoseconds to wait before sending (0 if the slot is free now)
+        """
+        now = time.monotonic_ns()
+        with self.request_lock:
+            slot = self._next_request_ns
+            if now >= slot:
+                self._next_request_ns = now + self._min_request_interval_ns
+                return 0
+            self._next_request_ns = slot + self._min_request_interval_ns
+        return slot - now
+
+    def _do_request(self, method: str, url: str, weight: int = 1) -> Dict[str, Any]:
+        """
+        Send HTTP request with rate limiting and retries.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL, including the query string
+            weight: API weight of this request (default: 1)
+            
+        Returns:
+            JSON response
+        """
         # Rate limiting with weight tracking
         self.rate_limiter.wait_if_needed(weight)
         
-        with self.request_lock:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.min_request_interval:
-                time.sleep(self.min_request_interval - elapsed)
-            self.last_request_time = time.time()
+        wait_ns = self._reserve_request_slot()
+        if wait_ns > 0:
+            time.sleep(wait_ns / 1e9)
         
         max_retries = 3
         retry_delay = 1
         
         for attempt in range(max_retries):
             try:
-                response = self.session.request(method, url, timeout=10, **kwargs)
-                response.raise_for_status()
-                
-                # Update rate limiter from response headers
-                self.rate_limiter.update_from_response(response.headers)
-                
-                return response.json()
-            except requests.exceptions.HTTPError as e:
-                error_msg = f"HTTP error: {e}"
-                try:
-                    error_data = response.json()
-                    error_code = error_data.get('code')
-                    error_msg = f"Binance API error [{error_code}]: {error_data.get('msg', error_data)}"
-                    
-                    if error_code == -1021:  # Timestamp error
-                        logger.warning("Timestamp out of sync, re-syncing...")
-                        self._sync_time()
-                        if attempt < max_retries - 1:
-                            continue
-                except:
-                    pass
-                logger.error(error_msg)
-                raise BinanceAPIError(error_msg) from e
-            except requests.exceptions.RequestException as e:
+                response = self.http.request(method, url, headers=self._headers, timeout=10)
+            except urllib3.exceptions.HTTPError as e:
                 if attempt < max_retries - 1:
                     logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}")
                     time.sleep(retry_delay * (2 ** attempt))
@@ -195,12 +617,37 @@ class BinanceFuturesClient:
                 error_msg = f"Request error after {max_retries} attempts: {e}"
                 logger.error(error_msg)
                 raise BinanceAPIError(error_msg) from e
+            
+            if response.status < 400:
+                # Update rate limiter from response headers
+                self.rate_limiter.update_from_response(response.headers)
+                
+                return _json_loads(response.data)
+            
+            if response.status in _RETRY_STATUSES and method == 'GET' and attempt < max_retries - 1:
+                logger.warning("HTTP %s (attempt %s/%s), retrying", response.status, attempt + 1, max_retries)
+                time.sleep(_RETRY_STATUS_DELAY * (2 ** attempt))
+                continue
+            
+            error_msg = f"HTTP error: {response.status} {response.reason} for url: {url.split('?', 1)[0]}"
+            error_code = None
+            try:
+                error_data = _json_loads(response.data)
+                error_code = error_data.get('code')
+                error_msg = f"Binance API error [{error_code}]: {error_data.get('msg', error_data)}"
+            except Exception:
+                pass
+            
+            if error_code == -1021:  # Timestamp error, re-signed by _request_signed
+                raise _TimestampError(error_msg)
+            logger.error(error_msg)
+            raise BinanceAPIError(error_msg)
 
     # ==================== Account Management ====================
 
     def get_account_info(self) -> Dict[str, Any]:
         """Get current account information including balances and positions."""
-        return self._request('GET', '/fapi/v2/account', signed=True, weight=5)
+        return self._request_signed('GET', '/fapi/v2/account', weight=5)
 
     def get_balance(self, asset: str = "USDT") -> Decimal:
         """
@@ -212,27 +659,13 @@ class BinanceFuturesClient:
         Returns:
             Available balance as Decimal
         """
-        # Check cache
-        current_time = time.time()
-        if (asset in self._balance_cache and 
-            current_time - self._balance_cache_time < self._balance_cache_ttl):
-            return self._balance_cache[asset]
-        
-        # Fetch fresh data
-        account_info = self.get_account_info()
-        
-        for asset_info in account_info.get('assets', []):
-            if asset_info['asset'] == asset:
-                balance = Decimal(asset_info['availableBalance'])
-                self._balance_cache[asset] = balance
-                self._balance_cache_time = current_time
-                return balance
-        
-        return Decimal('0')
+        snapshot = self._get_account_cached(self._balance_cache_ttl)
+        # Assets the account doesn't hold are absent, i.e. cached as zero
+        return snapshot.balances.get(asset, _DECIMAL_ZERO)
 
     def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Get current position for a symbol.
+        Get current position for a symbol (from the cached account snapshot).
         
         Args:
             symbol: Trading pair symbol
@@ -240,15 +673,43 @@ class BinanceFuturesClient:
         Returns:
             Position info or None if no position
         """
+        snapshot = self._get_account_cached(self._position_cache_ttl)
+        
+        for position in snapshot.positions.get(symbol, ()):
+            if Decimal(position['positionAmt']) != 0:
+                return position
+        
+        return None
+
+    def _get_account_cached(self, max_age: float) -> _AccountSnapshot:
+        """
+        Get the account snapshot, refreshing it if older than max_age seconds.
+        
+        Args:
+            max_age: Maximum acceptable snapshot age for this caller
+            
+        Returns:
+            Indexed balances and positions from one account info call
+        """
+        current_time = time.monotonic()
+        snapshot = self._account_snapshot
+        if snapshot is not None and current_time - snapshot.fetched_at < max_age:
+            return snapshot
+        
         account_info = self.get_account_info()
         
+        balances = {
+            asset_info['asset']: Decimal(asset_info['availableBalance'])
+            for asset_info in account_info.get('assets', [])
+        }
+        # In hedge mode a symbol has several entries (LONG/SHORT), keep them all
+        positions: Dict[str, List[Dict[str, Any]]] = {}
         for position in account_info.get('positions', []):
-            if position['symbol'] == symbol:
-                position_amt = Decimal(position['positionAmt'])
-                if position_amt != 0:
-                    return position
+            positions.setdefault(position['symbol'], []).append(position)
         
-        return None
+        snapshot = _AccountSnapshot(balances=balances, positions=positions, fetched_at=current_time)
+        self._account_snapshot = snapshot
+        return snapshot
 
     # ==================== Leverage & Margin Management ====================
 
@@ -269,7 +730,7 @@ class BinanceFuturesClient:
         }
         
         logger.info(f"Setting leverage for {symbol}: {leverage}x")
-        result = self._request('POST', '/fapi/v1/leverage', signed=True, weight=1, params=params)
+        result = self._request_signed('POST', '/fapi/v1/leverage', weight=1, params=params)
         logger.info(f"Leverage set successfully: {leverage}x")
         
         return result
@@ -293,7 +754,7 @@ class BinanceFuturesClient:
         logger.info(f"Setting margin type for {symbol}: {margin_type.value}")
         
         try:
-            result = self._request('POST', '/fapi/v1/marginType', signed=True, weight=1, params=params)
+            result = self._request_signed('POST', '/fapi/v1/marginType', weight=1, params=params)
             logger.info(f"Margin type set successfully: {margin_type.value}")
             return result
         except BinanceAPIError as e:
@@ -319,7 +780,7 @@ class BinanceFuturesClient:
         logger.info(f"Setting position mode: {mode}")
         
         try:
-            result = self._request('POST', '/fapi/v1/positionSide/dual', signed=True, weight=1, params=params)
+            result = self._request_signed('POST', '/fapi/v1/positionSide/dual', weight=1, params=params)
             logger.info(f"Position mode set successfully: {mode}")
             return result
         except BinanceAPIError as e:
@@ -337,7 +798,99 @@ class BinanceFuturesClient:
         if symbol:
             params['symbol'] = symbol
         
-        return self._request('GET', '/fapi/v1/exchangeInfo', weight=1, params=params)
+        return self._request_public('GET', '/fapi/v1/exchangeInfo', weight=1, params=params)
+
+    def _cache_symbol_info(self, symbol_info: Dict[str, Any]) -> None:
+        """Store symbol info and its filters indexed by filterType in the shared caches."""
+        cache_key = (self.base_url, symbol_info['symbol'])
+        _symbol_filters_cache[cache_key] = {f['filterType']: f for f in symbol_info.get('filters', [])}
+        _symbol_info_cache[cache_key] = symbol_info
+
+    def _symbol_disk_cache_path(self) -> str:
+        """Path of the on-disk exchangeInfo cache for this base URL."""
+        url_digest = hashlib.sha1(self.base_url.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(_SYMBOL_DISK_CACHE_DIR, f"{url_digest}.filters.json")
+
+    def _load_symbols_from_disk(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load cached {symbol: symbol_info} if the disk cache is fresh and only we could have written it."""
+        cache_path = self._symbol_disk_cache_path()
+        try:
+            with open(cache_path, 'rb') as f:
+                file_stat = os.fstat(f.fileno())
+                # Owner and permission bits only mean something on POSIX (Windows
+                # reports every file as 0o666 and has no getuid)
+                if hasattr(os, 'getuid') and (
+                    file_stat.st_uid != os.getuid() or file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+                ):
+                    logger.warning(
+                        f"Ignoring exchange info cache {cache_path}: not owned by this user or writable by others"
+                    )
+                    return None
+                if time.time() - file_stat.st_mtime > _SYMBOL_DISK_CACHE_TTL:
+                    return None
+                symbols = _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable exchange info cache {cache_path}: {e}")
+            return None
+        
+        return symbols if isinstance(symbols, dict) else None
+
+    def _save_symbols_to_disk(self, symbols: Dict[str, Dict[str, Any]]) -> None:
+        """Persist {symbol: symbol_info} to the disk cache."""
+        cache_path = self._symbol_disk_cache_path()
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(_SYMBOL_DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(symbols))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to write exchange info cache {cache_path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _warm_symbol_cache(self) -> None:
+        """Populate the shared symbol info cache from a full exchangeInfo payload."""
+        symbols = self._load_symbols_from_disk()
+        
+        if symbols is None:
+            try:
+                exchange_info = self.get_exchange_info()
+            except BinanceAPIError as e:
+                logger.warning(f"Failed to prefetch exchange info: {e}")
+                return
+            
+            symbols = {info['symbol']: info for info in exchange_info.get('symbols', [])}
+            self._save_symbols_to_disk(symbols)
+        
+        for symbol_info in symbols.values():
+            self._cache_symbol_info(symbol_info)
+        
+        _warmed_base_urls.add(self.base_url)
+        logger.info(f"Cached symbol info for {len(symbols)} symbols")
+
+    def prime_symbol_cache(self) -> None:
+        """
+        Load exchange info for all symbols and precompute their precision rules.
+        
+        Call once at startup so the first trade on a symbol doesn't pay an
+        exchangeInfo round-trip. The caches are shared by every client with
+        the same base URL.
+        """
+        if self.base_url not in _warmed_base_urls:
+            self._warm_symbol_cache()
+        
+        for (base_url, symbol) in list(_symbol_info_cache):
+            if base_url == self.base_url:
+                try:
+                    self._get_symbol_precision(symbol)
+                except (ArithmeticError, ValueError) as e:
+                    logger.debug("Skipping precision rules for %s: %s", symbol, e)
 
     def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
         """
@@ -349,30 +902,71 @@ class BinanceFuturesClient:
         Returns:
             Symbol info including filters
         """
-        if symbol in self._symbol_info_cache:
-            return self._symbol_info_cache[symbol]
+        cache_key = (self.base_url, symbol)
+        symbol_info = _symbol_info_cache.get(cache_key)
+        if symbol_info is not None:
+            return symbol_info
+        
+        # First miss: load every symbol with a single exchangeInfo call
+        if self.base_url not in _warmed_base_urls:
+            self._warm_symbol_cache()
+            symbol_info = _symbol_info_cache.get(cache_key)
+            if symbol_info is not None:
+                return symbol_info
         
+        # Not in the bulk payload (e.g. newly listed) - query it directly
         exchange_info = self.get_exchange_info(symbol)
         
         for symbol_info in exchange_info.get('symbols', []):
             if symbol_info['symbol'] == symbol:
-                self._symbol_info_cache[symbol] = symbol_info
+                self._cache_symbol_info(symbol_info)
                 return symbol_info
         
         raise BinanceAPIError(f"Symbol not found: {symbol}")
 
     def get_symbol_filters(self, symbol: str) -> Dict[str, Any]:
-        """Get trading filters for a specific symbol."""
-        symbol_info = self.get_symbol_info(symbol)
-        
-        filters = {}
-        for f in symbol_info.get('filters', []):
-            filters[f['filterType']] = f
-        
-        return filters
+        """Get trading filters for a specific symbol (cached per process)."""
+        cache_key = (self.base_url, symbol)
+        filters = _symbol_filters_cache.get(cache_key)
+        if filters is not None:
+            return filters
+        
+        # Loading the symbol indexes its filters as a side effect
+        self.get_symbol_info(symbol)
+        return _symbol_filters_cache[cache_key]
 
     # ==================== Precision Handling ====================
 
+    def _get_symbol_precision(self, symbol: str) -> _SymbolPrecision:
+        """Get the symbol's parsed precision filters (cached per process)."""
+        cache_key = (self.base_url, symbol)
+        precision = _symbol_precision_cache.get(cache_key)
+        if precision is not None:
+            return precision
+        
+        filters = self.get_symbol_filters(symbol)
+        lot_size = filters.get('LOT_SIZE', {})
+        price_filter = filters.get('PRICE_FILTER', {})
+        min_notional_filter = filters.get('MIN_NOTIONAL', {})
+        
+        precision = _SymbolPrecision(
+            quantity=_build_step_rule(
+                lot_size.get('stepSize', '0.001'),
+                lot_size.get('minQty', '0'),
+                lot_size.get('maxQty', '9000000')
+            ),
+            price=_build_step_rule(
+                price_filter.get('tickSize', '0.01'),
+                price_filter.get('minPrice', '0'),
+                price_filter.get('maxPrice', '1000000')
+            ),
+            min_notional=(
+                Decimal(min_notional_filter.get('notional', '0')) if min_notional_filter else None
+            )
+        )
+        _symbol_precision_cache[cache_key] = precision
+        return precision
+
     def adjust_quantity_precision(self, symbol: str, quantity: float) -> str:
         """
         Adjust quantity to match symbol's LOT_SIZE filter.
@@ -384,27 +978,18 @@ class BinanceFuturesClient:
         Returns:
             Formatted quantity string
         """
-        filters = self.get_symbol_filters(symbol)
-        lot_size = filters.get('LOT_SIZE', {})
-        
-        step_size = Decimal(lot_size.get('stepSize', '0.001'))
-        min_qty = Decimal(lot_size.get('minQty', '0'))
-        max_qty = Decimal(lot_size.get('maxQty', '9000000'))
-        
-        qty_decimal = Decimal(str(quantity))
-        
-        if qty_decimal < min_qty:
-            raise ValueError(f"Quantity {quantity} below minimum {min_qty} for {symbol}")
-        if qty_decimal > max_qty:
-            qty_decimal = max_qty
+        rule = self._get_symbol_precision(symbol).quantity
+        units = _to_units(quantity, rule)
         
-        # Adjust to step size
-        precision = abs(step_size.as_tuple().exponent)
-        qty_decimal = (qty_decimal / step_size).quantize(Decimal('1'), rounding=ROUND_DOWN) * step_size
+        if units < rule.min_units:
+            raise ValueError(f"Quantity {quantity} below minimum {_format_units(rule.min_units, rule)} for {symbol}")
+        if units > rule.max_units:
+            units = rule.max_units
         
-        qty_str = f"{qty_decimal:.{precision}f}".rstrip('0').rstrip('.')
+        # Adjust to step size (round down)
+        units -= units % rule.step
         
-        return qty_str
+        return _format_units(units, rule)
 
     def adjust_price_precision(self, symbol: str, price: float) -> str:
         """
@@ -417,27 +1002,18 @@ class BinanceFuturesClient:
         Returns:
             Formatted price string
         """
-        filters = self.get_symbol_filters(symbol)
-        price_filter = filters.get('PRICE_FILTER', {})
-        
-        tick_size = Decimal(price_filter.get('tickSize', '0.01'))
-        min_price = Decimal(price_filter.get('minPrice', '0'))
-        max_price = Decimal(price_filter.get('maxPrice', '1000000'))
-        
-        price_decimal = Decimal(str(price))
+        rule = self._get_symbol_precision(symbol).price
+        units = _to_units(price, rule)
         
-        if price_decimal < min_price:
-            raise ValueError(f"Price {price} below minimum {min_price} for {symbol}")
-        if price_decimal > max_price:
-            price_decimal = max_price
+        if units < rule.min_units:
+            raise ValueError(f"Price {price} below minimum {_format_units(rule.min_units, rule)} for {symbol}")
+        if units > rule.max_units:
+            units = rule.max_units
         
-        # Adjust to tick size
-        precision = abs(tick_size.as_tuple().exponent)
-        price_decimal = (price_decimal / tick_size).quantize(Decimal('1'), rounding=ROUND_DOWN) * tick_size
+        # Adjust to tick size (round down)
+        units -= units % rule.step
         
-        price_str = f"{price_decimal:.{precision}f}".rstrip('0').rstrip('.')
-        
-        return price_str
+        return _format_units(units, rule)
 
     def check_min_notional(self, symbol: str, quantity: float, price: float) -> bool:
         """
@@ -451,17 +1027,27 @@ class BinanceFuturesClient:
         Returns:
             True if meets requirement, False otherwise
         """
-        filters = self.get_symbol_filters(symbol)
-        min_notional_filter = filters.get('MIN_NOTIONAL', {})
+        min_notional = self._get_symbol_precision(symbol).min_notional
         
-        if not min_notional_filter:
+        if min_notional is None:
             return True
         
-        min_notional = Decimal(min_notional_filter.get('notional', '0'))
         order_notional = Decimal(str(quantity)) * Decimal(str(price))
         
         return order_notional >= min_notional
 
+    def get_min_notional(self, symbol: str) -> Optional[Decimal]:
+        """
+        Get the symbol's MIN_NOTIONAL from the cached precision rules.
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            Minimum order value, or None if the symbol has no MIN_NOTIONAL filter
+        """
+        return self._get_symbol_precision(symbol).min_notional
+
     # ==================== Order Management ====================
 
     def place_order(
@@ -496,40 +1082,47 @@ class BinanceFuturesClient:
         # Adjust quantity precision
         adjusted_qty = self.adjust_quantity_precision(symbol, quantity)
         
-        params = {
-            'symbol': symbol,
-            'side': side.upper(),
-            'type': order_type.upper(),
-            'quantity': adjusted_qty,
-            'positionSide': position_side.value
-        }
+        order_type = order_type.upper()
+        
+        # Order params have a fixed shape and URL-safe values, so the query is
+        # a cached per-shape prefix plus the variable fields, not an encoded dict;
+        # the prefix's HMAC state is cached too, so signing only hashes the rest
+        prefix_key = (symbol, side, order_type, position_side)
+        signed_prefix = self._order_prefix_cache.get(prefix_key)
+        if signed_prefix is None:
+            prefix = _ORDER_QUERY_PREFIX.format(symbol, side.upper(), order_type, position_side.value)
+            prefix_mac = self._hmac_proto.copy()
+            prefix_mac.update(prefix.encode("ascii"))
+            signed_prefix = self._order_prefix_cache[prefix_key] = (prefix, prefix_mac)
+        query = f"{signed_prefix[0]}&quantity={adjusted_qty}"
         
         if reduce_only:
-            params['reduceOnly'] = 'true'
+            query += "&reduceOnly=true"
         
-        if order_type.upper() == 'LIMIT':
+        adjusted_price = None
+        if order_type == 'LIMIT':
             if price is None:
                 raise ValueError("Price is required for LIMIT orders")
             adjusted_price = self.adjust_price_precision(symbol, price)
-            params['price'] = adjusted_price
-            params['timeInForce'] = time_in_force
+            query += f"&price={adjusted_price}&timeInForce={time_in_force}"
             
             # Check MIN_NOTIONAL
             if not self.check_min_notional(symbol, quantity, price):
-                filters = self.get_symbol_filters(symbol)
-                min_notional = filters.get('MIN_NOTIONAL', {}).get('notional', 'N/A')
-                raise ValueError(f"Order value too small. MIN_NOTIONAL: {min_notional}")
+                raise ValueError(f"Order value too small. MIN_NOTIONAL: {self.get_min_notional(symbol)}")
         
         if stop_price is not None:
             adjusted_stop_price = self.adjust_price_precision(symbol, stop_price)
-            params['stopPrice'] = adjusted_stop_price
+            query += f"&stopPrice={adjusted_stop_price}"
         
-        logger.info(f"Placing {side} {order_type} order: {adjusted_qty} {symbol}" + 
-                   (f" @ {params.get('price')}" if price else ""))
+        # %-style args: formatting is skipped entirely when INFO is disabled
+        if price:
+            logger.info("Placing %s %s order: %s %s @ %s", side, order_type, adjusted_qty, symbol, adjusted_price)
+        else:
+            logger.info("Placing %s %s order: %s %s", side, order_type, adjusted_qty, symbol)
         
-        result = self._request('POST', '/fapi/v1/order', signed=True, weight=1, params=params)
+        result = self._request_signed('POST', '/fapi/v1/order', weight=1, query=query, signed_prefix=signed_prefix)
         
-        logger.info(f"Order placed: orderId={result.get('orderId')}, status={result.get('status')}")
+        logger.info("Order placed: orderId=%s, status=%s", result.get('orderId'), result.get('status'))
         
         return result
 
@@ -546,7 +1139,6 @@ class BinanceFuturesClient:
         if len(orders) > 5:
             raise ValueError("Maximum 5 orders per batch")
         
-        import json
         batch_orders = []
         
         for order in orders:
@@ -565,12 +1157,12 @@ class BinanceFuturesClient:
             batch_orders.append(order_params)
         
         params = {
-            'batchOrders': json.dumps(batch_orders)
+            'batchOrders': _json_dumps(batch_orders)
         }
         
-        logger.info(f"Placing batch order: {len(batch_orders)} orders")
-        result = self._request('POST', '/fapi/v1/batchOrders', signed=True, weight=5, params=params)
-        logger.info(f"Batch order placed successfully")
+        logger.info("Placing batch order: %d orders", len(batch_orders))
+        result = self._request_signed('POST', '/fapi/v1/batchOrders', weight=5, params=params)
+        logger.info("Batch order placed successfully")
         
         return result
 
@@ -579,7 +1171,7 @@ class BinanceFuturesClient:
     def create_listen_key(self) -> str:
         """Create a user data stream listenKey."""
         logger.info("Creating new listen key")
-        data = self._request('POST', '/fapi/v1/listenKey', weight=1)
+        data = self._request_public('POST', '/fapi/v1/listenKey', weight=1)
         listen_key = data['listenKey']
         logger.info(f"Listen key created: {listen_key[:8]}...")
         return listen_key
@@ -587,25 +1179,25 @@ class BinanceFuturesClient:
     def keepalive_listen_key(self, listen_key: str) -> None:
         """Keep the user data stream alive."""
         logger.debug(f"Keeping listen key alive: {listen_key[:8]}...")
-        self._request('PUT', '/fapi/v1/listenKey', weight=1)
+        self._request_public('PUT', '/fapi/v1/listenKey', weight=1)
 
     def close_listen_key(self, listen_key: str) -> None:
         """Close a user data stream."""
         logger.info(f"Closing listen key: {listen_key[:8]}...")
-        self._request('DELETE', '/fapi/v1/listenKey', weight=1)
+        self._request_public('DELETE', '/fapi/v1/listenKey', weight=1)
 
     # ==================== Market Data ====================
 
     def get_ticker_price(self, symbol: str) -> Decimal:
         """Get current market price for a symbol."""
         params = {'symbol': symbol}
-        result = self._request('GET', '/fapi/v1/ticker/price', weight=1, params=params)
+        result = self._request_public('GET', '/fapi/v1/ticker/price', weight=1, params=params)
         return Decimal(result['price'])
 
     def get_mark_price(self, symbol: str) -> Decimal:
         """Get current mark price for a symbol."""
         params = {'symbol': symbol}
-        result = self._request('GET', '/fapi/v1/premiumIndex', weight=1, params=params)
+        result = self._request_public('GET', '/fapi/v1/premiumIndex', weight=1, params=params)
         return Decimal(result['markPrice'])
     
     # ==================== Statistics ====================
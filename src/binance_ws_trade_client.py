@@ -0,0 +1,304 @@
+"""Binance Futures WebSocket API client for low-latency order placement."""
+
+import time
+import socket
+import logging
+from itertools import count
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Optional
+
+import websocket
+
+from .binance_futures_client import (
+    BinanceFuturesClient, BinanceAPIError, PositionSide, _TimestampError, _json_dumps, _json_loads
+)
+
+
+logger = logging.getLogger(__name__)
+
+WS_API_URL = "wss://ws-fapi.binance.com/ws-fapi/v1"
+WS_API_TESTNET_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+
+# Socket options for Binance WebSocket connections: no Nagle delay on small
+# frames, and a 1 MiB receive buffer to absorb bursts of events
+_WS_SOCKET_OPTIONS = (
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+)
+
+# A connection silent this long is pinged, and closed if the next interval
+# is silent too, so a half-open socket stops looking connected
+_PING_INTERVAL = 15  # seconds
+
+# Attempts per request when Binance rejects its timestamp (-1021)
+_MAX_TIMESTAMP_ATTEMPTS = 3
+
+
+class WSTradeUnavailableError(BinanceAPIError):
+    """The order was not sent because the WebSocket API connection is down."""
+    pass
+
+
+class _PendingRequest:
+    """A sent request waiting for its id-matched response."""
+
+    __slots__ = ('event', 'response')
+
+    def __init__(self) -> None:
+        self.event = Event()
+        self.response: Optional[Dict[str, Any]] = None
+
+
+class BinanceWSTradeClient:
+    """
+    Places orders over a persistent Binance Futures WebSocket API connection.
+
+    Reuses the REST client's API key, signer, time offset and symbol
+    precision rules; only the transport differs. An order that finds the
+    connection down fails fast (so the caller can use REST) and the
+    connection is re-opened in the background.
+    """
+
+    def __init__(self, rest_client: BinanceFuturesClient, ws_url: str = WS_API_URL, timeout: float = 10) -> None:
+        """
+        Initialize WebSocket API trade client.
+
+        Args:
+            rest_client: REST client of the same account
+            ws_url: WebSocket API endpoint
+            timeout: Seconds to wait for connect and for each order response
+        """
+        self.rest_client = rest_client
+        self.ws_url = ws_url
+        self.timeout = timeout
+
+        self.ws: Optional[websocket.WebSocket] = None
+        self.reader_thread: Optional[Thread] = None
+        self.connect_lock = Lock()
+        self.send_lock = Lock()
+        self.reconnect_thread: Optional[Thread] = None
+        self._reconnect_lock = Lock()
+
+        self._request_ids = count(1)
+        self._pending: Dict[int, _PendingRequest] = {}
+
+    @property
+    def connected(self) -> bool:
+        """Whether the WebSocket API connection is open."""
+        return self.ws is not None and self.ws.connected
+
+    def connect(self) -> None:
+        """
+        Open the WebSocket API connection if it isn't already.
+
+        Raises:
+            WSTradeUnavailableError: If the connection cannot be opened
+        """
+        with self.connect_lock:
+            if self.connected:
+                return
+            try:
+                ws = websocket.create_connection(
+                    self.ws_url,
+                    timeout=self.timeout,
+                    skip_utf8_validation=True,
+                    sockopt=_WS_SOCKET_OPTIONS
+                )
+            except Exception as e:
+                raise WSTradeUnavailableError(f"WebSocket API connect failed: {e}") from e
+            # The reader wakes after _PING_INTERVAL without a frame to check
+            # the connection is alive; order timeouts are per request
+            ws.settimeout(_PING_INTERVAL)
+            self.ws = ws
+            self.reader_thread = Thread(target=self._read_loop, args=(ws,), daemon=True)
+            self.reader_thread.start()
+            logger.info(f"Connected to WebSocket API: {self.ws_url}")
+
+    def reconnect_in_background(self) -> None:
+        """Start re-opening the connection on a background thread, unless one already is."""
+        with self._reconnect_lock:
+            if self.reconnect_thread is not None and self.reconnect_thread.is_alive():
+                return
+            self.reconnect_thread = Thread(target=self._reconnect, name="ws-api-reconnect", daemon=True)
+            self.reconnect_thread.start()
+
+    def _reconnect(self) -> None:
+        """Re-open the connection, logging (not raising) a failure."""
+        try:
+            self.connect()
+        except WSTradeUnavailableError as e:
+            logger.warning(f"WebSocket API reconnect failed: {e}")
+
+    def close(self) -> None:
+        """Close the WebSocket API connection."""
+        ws = self.ws
+        if ws is not None:
+            ws.close()
+
+    def _read_loop(self, ws: websocket.WebSocket) -> None:
+        """Dispatch responses to their waiting requests until the connection drops."""
+        awaiting_pong = False
+        try:
+            while True:
+                try:
+                    opcode, message = ws.recv_data(control_frame=True)
+                except websocket.WebSocketTimeoutException:
+                    if awaiting_pong:
+                        raise websocket.WebSocketTimeoutException(f"no pong within {_PING_INTERVAL}s")
+                    with self.send_lock:
+                        ws.ping()
+                    awaiting_pong = True
+                    continue
+                # Any frame, pong or otherwise, shows the connection is alive
+                awaiting_pong = False
+                if opcode == websocket.ABNF.OPCODE_CLOSE:
+                    break
+                if opcode not in (websocket.ABNF.OPCODE_TEXT, websocket.ABNF.OPCODE_BINARY) or not message:
+                    continue
+                response = _json_loads(message)
+                pending = self._pending.pop(response.get('id'), None)
+                if pending is not None:
+                    pending.response = response
+                    pending.event.set()
+        except Exception as e:
+            if ws.connected:
+                logger.warning(f"WebSocket API connection lost: {e}")
+        finally:
+            ws.close()
+            # Wake every request still waiting on this connection
+            for request_id in list(self._pending):
+                pending = self._pending.pop(request_id, None)
+                if pending is not None:
+                    pending.event.set()
+
+    def _send_signed(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sign params, send a request and wait for its response.
+
+        Args:
+            method: WebSocket API method, e.g. 'order.place'
+            params: Request parameters (apiKey/timestamp/signature are added)
+
+        Returns:
+            The response's result
+
+        Raises:
+            WSTradeUnavailableError: If the request could not be sent
+            BinanceAPIError: If Binance rejected it or no response arrived
+        """
+        # Never connect on the order path: that can block for the whole
+        # connect timeout, while REST is ready now
+        if not self.connected:
+            self.reconnect_in_background()
+            raise WSTradeUnavailableError("WebSocket API not connected")
+
+        client = self.rest_client
+        params['apiKey'] = client.api_key
+        for attempt in range(_MAX_TIMESTAMP_ATTEMPTS):
+            time_generation = client._host.time_generation
+            try:
+                return self._send_signed_once(method, params)
+            except _TimestampError as e:
+                # Rejected, so never placed: correct the offset and re-sign,
+                # exactly as the REST client does
+                if attempt == _MAX_TIMESTAMP_ATTEMPTS - 1:
+                    logger.error(str(e))
+                    raise
+                client._recover_from_timestamp_error(e, time_generation, first_attempt=attempt == 0)
+
+    def _send_signed_once(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Sign params with a fresh timestamp, send them and wait for the response."""
+        client = self.rest_client
+        params.pop('signature', None)
+        params['timestamp'] = client._get_timestamp()
+        # WebSocket API signs the params sorted by key, as a query string
+        payload = '&'.join(f"{key}={params[key]}" for key in sorted(params))
+        params['signature'] = client._signature(payload)
+
+        request_id = next(self._request_ids)
+        pending = self._pending[request_id] = _PendingRequest()
+        message = _json_dumps({'id': request_id, 'method': method, 'params': params})
+
+        ws = self.ws
+        try:
+            with self.send_lock:
+                ws.send(message)
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            self.close()
+            raise WSTradeUnavailableError(f"WebSocket API send failed: {e}") from e
+
+        # Once sent, never fall back to REST: the order may have been accepted
+        if not pending.event.wait(self.timeout):
+            self._pending.pop(request_id, None)
+            raise BinanceAPIError(f"WebSocket API {method} timed out after {self.timeout}s (id={request_id})")
+
+        response = pending.response
+        if response is None:
+            raise BinanceAPIError(f"WebSocket API connection lost awaiting {method} (id={request_id})")
+        if response.get('status') != 200:
+            error = response.get('error', {})
+            error_msg = f"Binance API error [{error.get('code')}]: {error.get('msg', error)}"
+            if error.get('code') == -1021:
+                raise _TimestampError(error_msg)
+            raise BinanceAPIError(error_msg)
+        return response['result']
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        position_side: PositionSide = PositionSide.BOTH,
+        time_in_force: str = 'GTC'
+    ) -> Dict[str, Any]:
+        """
+        Place an order over the WebSocket API (same rules as the REST place_order).
+
+        Args:
+            symbol: Trading pair symbol
+            side: BUY or SELL
+            order_type: MARKET or LIMIT
+            quantity: Order quantity
+            price: Order price (required for LIMIT orders)
+            position_side: BOTH, LONG, or SHORT
+            time_in_force: GTC, IOC, FOK
+
+        Returns:
+            Order response
+
+        Raises:
+            WSTradeUnavailableError: If the order was not sent (safe to retry over REST)
+        """
+        client = self.rest_client
+        order_type = order_type.upper()
+        params: Dict[str, Any] = {
+            'symbol': symbol,
+            'side': side.upper(),
+            'type': order_type,
+            'positionSide': position_side.value,
+            'quantity': client.adjust_quantity_precision(symbol, quantity)
+        }
+
+        if order_type == 'LIMIT':
+            if price is None:
+                raise ValueError("Price is required for LIMIT orders")
+            params['price'] = client.adjust_price_precision(symbol, price)
+            params['timeInForce'] = time_in_force
+
+            if not client.check_min_notional(symbol, quantity, price):
+                raise ValueError(f"Order value too small. MIN_NOTIONAL: {client.get_min_notional(symbol)}")
+
+        logger.info("Placing %s %s order via WebSocket API: %s %s", side, order_type, params['quantity'], symbol)
+
+        start_ns = time.perf_counter_ns()
+        result = self._send_signed('order.place', params)
+
+        logger.info(
+            "Order placed: orderId=%s, status=%s, ack=%.1fms",
+            result.get('orderId'), result.get('status'), (time.perf_counter_ns() - start_ns) / 1e6
+        )
+
+        return result
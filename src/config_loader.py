@@ -1,9 +1,20 @@
 """Configuration loader for Binance copy trading bot."""
 
-import os
 import yaml
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# msgspec builds and type-checks the dataclasses below in C in one pass;
+# without it the hand-rolled parser in _parse_config_fields is used
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 @dataclass
@@ -19,24 +30,24 @@ class FollowerConfig:
     name: str
     api_key: str
     api_secret: str
-    scale: float
-    enabled: bool
+    scale: float = 1.0
+    enabled: bool = True
 
 
 @dataclass
 class TradingConfig:
     """Trading settings configuration."""
-    follower_order_type: str
-    min_order_quantity: float
-    max_order_quantity: float
-    allowed_symbols: List[str]
-    excluded_symbols: List[str]
+    follower_order_type: str = 'MARKET'
+    min_order_quantity: float = 0.001
+    max_order_quantity: float = 1000.0
+    allowed_symbols: List[str] = field(default_factory=list)
+    excluded_symbols: List[str] = field(default_factory=list)
     # Futures specific
     leverage: int = 10
     margin_type: str = 'CROSSED'
     position_mode: str = 'one_way'
     auto_set_leverage: bool = True
-    symbol_leverage: Dict[str, int] = None
+    symbol_leverage: Optional[Dict[str, int]] = None
     
     def __post_init__(self):
         if self.symbol_leverage is None:
@@ -50,29 +61,30 @@ class TradingConfig:
 @dataclass
 class LoggingConfig:
     """Logging configuration."""
-    level: str
-    file: str
-    max_bytes: int
-    backup_count: int
-    console_output: bool
+    level: str = 'INFO'
+    file: str = 'logs/copy_trade.log'
+    max_bytes: int = 10485760
+    backup_count: int = 5
+    console_output: bool = True
 
 
 @dataclass
 class WebSocketConfig:
     """WebSocket configuration."""
-    reconnect_enabled: bool
-    reconnect_delay: int
-    max_reconnect_attempts: int
-    keepalive_interval: int
+    reconnect_enabled: bool = True
+    reconnect_delay: int = 5
+    max_reconnect_attempts: int = 10
+    keepalive_interval: int = 1800
+    order_api_enabled: bool = True  # place follower orders over the WebSocket API
 
 
 @dataclass
 class RiskManagementConfig:
     """Risk management configuration."""
-    enabled: bool
-    max_daily_trades: int
-    max_daily_loss_percentage: float
-    max_position_size_percentage: float
+    enabled: bool = False
+    max_daily_trades: int = 100
+    max_daily_loss_percentage: float = 5.0
+    max_position_size_percentage: float = 10.0
     min_balance_required: float = 10.0
     emergency_stop_percentage: float = 50.0
 
@@ -83,10 +95,10 @@ class Config:
     base_url: str
     master: MasterConfig
     followers: List[FollowerConfig]
-    trading: TradingConfig
-    logging: LoggingConfig
-    websocket: WebSocketConfig
-    risk_management: RiskManagementConfig
+    trading: TradingConfig = field(default_factory=TradingConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    websocket: WebSocketConfig = field(default_factory=WebSocketConfig)
+    risk_management: RiskManagementConfig = field(default_factory=RiskManagementConfig)
 
 
 def load_config(config_path: str = "config.yaml") -> Config:
@@ -103,24 +115,53 @@ def load_config(config_path: str = "config.yaml") -> Config:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config file is invalid
     """
-    if not os.path.exists(config_path):
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration file not found: {config_path}\n"
             f"Please copy config.example.yaml to config.yaml and fill in your API credentials."
         )
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    return _parse_config(data)
+
+
+def _parse_config(data: Optional[Dict[str, Any]]) -> Config:
+    """
+    Build a Config object from parsed YAML data.
     
+    Args:
+        data: Parsed YAML document
+        
+    Returns:
+        Config object with all settings
+        
+    Raises:
+        ValueError: If config data is invalid
+    """
     if not data:
         raise ValueError("Configuration file is empty")
     
     # Validate required fields
     required_fields = ['base_url', 'master', 'followers']
-    for field in required_fields:
-        if field not in data:
-            raise ValueError(f"Missing required field in config: {field}")
+    for field_name in required_fields:
+        if field_name not in data:
+            raise ValueError(f"Missing required field in config: {field_name}")
     
+    if msgspec is not None:
+        # strict=False: accept what the field-by-field parser accepts
+        # (e.g. "0.5" for a float), so a config loads the same either way
+        try:
+            return msgspec.convert(data, type=Config, strict=False)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid config: {e}") from e
+    
+    return _parse_config_fields(data)
+
+
+def _parse_config_fields(data: Dict[str, Any]) -> Config:
+    """Build a Config object field by field (used when msgspec is unavailable)."""
     # Parse master config
     master_data = data['master']
     master = MasterConfig(
@@ -171,7 +212,8 @@ def load_config(config_path: str = "config.yaml") -> Config:
         reconnect_enabled=ws_data.get('reconnect_enabled', True),
         reconnect_delay=ws_data.get('reconnect_delay', 5),
         max_reconnect_attempts=ws_data.get('max_reconnect_attempts', 10),
-        keepalive_interval=ws_data.get('keepalive_interval', 1800)
+        keepalive_interval=ws_data.get('keepalive_interval', 1800),
+        order_api_enabled=ws_data.get('order_api_enabled', True)
     )
     
     # Parse risk management config
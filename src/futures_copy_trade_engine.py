@@ -1,24 +1,103 @@
 """Futures copy trading engine with advanced features."""
 
-import json
+import sys
 import time
+import random
+import queue
 import logging
-from threading import Thread, Event, Lock
-from typing import Dict, List, Optional, Set
-from datetime import datetime
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Thread, Event, Lock, local
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from operator import itemgetter
 
 import websocket
 
+# Fastest available JSON decoder for WebSocket frames (all accept str and bytes)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
 from .binance_futures_client import BinanceFuturesClient, BinanceAPIError, PositionSide, MarginType
+from .binance_ws_trade_client import (
+    BinanceWSTradeClient, WSTradeUnavailableError, WS_API_URL, WS_API_TESTNET_URL, _WS_SOCKET_OPTIONS
+)
 from .config_loader import Config
-from .circuit_breaker import CircuitBreakerManager
+from .circuit_breaker import CircuitBreaker, CircuitBreakerManager
 from .trade_logger import TradeLogger
 
 
 logger = logging.getLogger(__name__)
 
 
+class _Fill(NamedTuple):
+    """A master fill to copy (quantity is scaled per follower before placing)."""
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    position_side: str
+
+
+class _Follower(NamedTuple):
+    """An enabled follower with everything its order path needs, resolved once."""
+    name: str
+    client: BinanceFuturesClient
+    scale: float
+    ws_client: Optional[BinanceWSTradeClient]  # None when the WebSocket API is disabled
+    breaker: CircuitBreaker
+    balance_lock: Lock
+
+
+class _StatsCounters:
+    """One thread's share of the engine counters (summed by get_statistics)."""
+
+    __slots__ = (
+        'total_trades', 'successful_copies', 'failed_copies', 'duplicate_filtered',
+        'insufficient_balance', 'min_notional_rejected', 'ws_orders', 'ws_ack_time_ns'
+    )
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+
+# Hedge-mode position side of the master's fill ('BOTH' or unknown -> BOTH)
+_POSITION_SIDES: Dict[str, PositionSide] = {'LONG': PositionSide.LONG, 'SHORT': PositionSide.SHORT}
+
+# Order updates are handed off the WebSocket thread to worker threads,
+# sharded by symbol so fills on one symbol are still copied in order
+# (unbounded SimpleQueues: the WS reader never blocks on a slow worker)
+_EVENT_WORKERS = 4
+
+# Client pings detect a dead user data stream well before the server's
+# 3-minute pings would (ping_timeout must be below ping_interval)
+_WS_PING_INTERVAL = 20  # seconds
+_WS_PING_TIMEOUT = 10  # seconds
+
+_MAX_RECONNECT_DELAY = 60  # seconds, cap for the reconnect backoff
+_RECONNECT_JITTER = 0.25  # each delay is randomized by +/-25%
+
+# A repeating error logs its traceback at most once per interval
+_TRACEBACK_LOG_INTERVAL = 60  # seconds
+_MAX_TRACEBACK_KEYS = 1000  # error kinds remembered at once
+
+# Fills already queued when a worker wakes are copied together, as one
+# batchOrders request per follower (Binance accepts up to 5 orders) holding
+# at most one order per symbol
+_MAX_BATCH_ORDERS = 5
+
+# ORDER_TRADE_UPDATE order fields, extracted in one C-level call:
+# order status, order id, trade id, symbol, side, order type,
+# last filled qty/price, cumulative filled qty, order qty
+_ORDER_FIELDS = itemgetter('X', 'i', 't', 's', 'S', 'o', 'l', 'L', 'z', 'q')
+
+
 class FuturesCopyTradeEngine:
     """
     Advanced futures copy trading engine.
@@ -55,20 +134,61 @@ class FuturesCopyTradeEngine:
                     base_url=config.base_url
                 )
         
+        # Follower orders go over the WebSocket API when enabled (REST fallback)
+        self.follower_ws_clients: Dict[str, BinanceWSTradeClient] = {}
+        if config.websocket.order_api_enabled:
+            ws_api_url = WS_API_TESTNET_URL if 'testnet' in config.base_url else WS_API_URL
+            self.follower_ws_clients = {
+                name: BinanceWSTradeClient(client, ws_api_url)
+                for name, client in self.follower_clients.items()
+            }
+        
         # WebSocket state
         self.listen_key: Optional[str] = None
         self.ws: Optional[websocket.WebSocketApp] = None
         self.ws_thread: Optional[Thread] = None
-        self.keepalive_thread: Optional[Thread] = None
+        self.next_keepalive = 0.0  # monotonic time the listen key is next kept alive
         self.stop_event = Event()
         
+        # Order update processing off the WebSocket thread
+        self.event_queues: List[queue.SimpleQueue] = [
+            queue.SimpleQueue() for _ in range(_EVENT_WORKERS)
+        ]
+        self.event_workers: List[Thread] = []
+        
         # Reconnection state
         self.reconnect_count = 0
         self.is_running = False
         
-        # Order deduplication (use timestamp-based dict instead of deque)
-        self.processed_orders: Dict[str, float] = {}  # trade_key -> timestamp
-        self.order_lock = Lock()
+        # Trading settings read on every fill, resolved once
+        trading = config.trading
+        self._excluded_symbols = frozenset(sys.intern(s) for s in trading.excluded_symbols)
+        self._allowed_symbols = (
+            frozenset(sys.intern(s) for s in trading.allowed_symbols) if trading.allowed_symbols else None
+        )
+        # symbol -> allowed, decided once per symbol the master trades
+        self._symbol_policy: Dict[str, bool] = {}
+        self._min_order_quantity = trading.min_order_quantity
+        self._max_order_quantity = trading.max_order_quantity
+        self._follower_order_type = trading.follower_order_type
+        self._leverage = trading.get('leverage', 10)
+        self._symbol_leverage: Dict[str, int] = trading.get('symbol_leverage') or {}
+        self._position_mode = trading.get('position_mode', 'one_way')
+        
+        # Order deduplication, one shard per event worker: O(1) membership set
+        # plus an insertion-ordered FIFO so expired keys are evicted from the
+        # front, never scanned. A trade always lands on the same worker (its
+        # symbol's), so each shard has a single thread and needs no lock.
+        self.processed_orders: List[Set[Tuple[int, int]]] = [set() for _ in range(_EVENT_WORKERS)]
+        self.processed_order_fifos: List[Deque[Tuple[float, Tuple[int, int]]]] = [
+            deque() for _ in range(_EVENT_WORKERS)  # (monotonic time, (order id, trade id))
+        ]
+        self.processed_order_ttl = 3600  # 1 hour
+        
+        # Follower orders for one master fill are placed in parallel
+        # (stop() shuts the pool down; start() replaces it on a restart)
+        self.order_executor = self._create_order_executor()
+        self._order_executor_shut_down = False
         
         # Balance locks for concurrent safety
         self.follower_balance_locks: Dict[str, Lock] = {
@@ -84,31 +204,60 @@ class FuturesCopyTradeEngine:
                 timeout=300  # 5 minutes
             )
         
+        # Enabled followers, walked on every fill
+        self._active_followers: List[_Follower] = [
+            _Follower(
+                name=follower.name,
+                client=self.follower_clients[follower.name],
+                scale=follower.scale,
+                ws_client=self.follower_ws_clients.get(follower.name),
+                breaker=self.circuit_breaker_manager.get_breaker(f"follower_{follower.name}"),
+                balance_lock=self.follower_balance_locks[follower.name]
+            )
+            for follower in config.followers
+            if follower.enabled
+        ]
+        
         # Trade logger for persistence
         self.trade_logger = TradeLogger(log_file="logs/futures_trades.jsonl")
         
-        # Statistics
-        self.stats = {
-            'total_trades': 0,
-            'successful_copies': 0,
-            'failed_copies': 0,
-            'duplicate_filtered': 0,
-            'insufficient_balance': 0,
-            'min_notional_rejected': 0,
-            'start_time': None
-        }
+        # Statistics: each thread increments its own counters without
+        # locking; get_statistics() sums them. The lock only guards the
+        # registry, taken once per thread.
+        self._stats_local = local()
+        self._stats_shards: List[_StatsCounters] = []
+        self._stats_shards_lock = Lock()
+        self.start_time: Optional[datetime] = None  # wall clock, for display
+        self.start_monotonic = 0.0  # runtime is measured on the monotonic clock
+        
+        # (error type, message head) -> monotonic time its traceback was last
+        # logged, oldest first; shared by the event workers and order threads
+        self._traceback_logged_at: Dict[Tuple[str, str], float] = {}
+        self._traceback_lock = Lock()
         
         logger.info(f"Futures copy trade engine initialized with {len(self.follower_clients)} followers")
 
+    def _create_order_executor(self) -> ThreadPoolExecutor:
+        """Create the pool follower orders are placed on."""
+        return ThreadPoolExecutor(
+            max_workers=max(8, 2 * len(self.follower_clients)),
+            thread_name_prefix="follower-order"
+        )
+
     def start(self) -> None:
         """Start the copy trading engine."""
         if self.is_running:
             logger.warning("Engine is already running")
             return
         
+        if self._order_executor_shut_down:
+            self.order_executor = self._create_order_executor()
+            self._order_executor_shut_down = False
+        
         self.is_running = True
         self.stop_event.clear()
-        self.stats['start_time'] = datetime.now()
+        self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
         
         logger.info("Starting futures copy trade engine...")
         
@@ -116,12 +265,28 @@ class FuturesCopyTradeEngine:
             # Initialize account settings
             self._initialize_accounts()
             
-            # Create listen key
-            self.listen_key = self.master_client.create_listen_key()
+            # Load symbol filters for every symbol up front (shared by all
+            # clients) so the first copied trade skips the exchangeInfo fetch
+            try:
+                self.master_client.prime_symbol_cache()
+            except Exception as e:
+                logger.warning(f"Failed to prefetch exchange info: {e}")
+            
+            # Open follower connections now so the first copied trade
+            # doesn't pay TLS handshakes
+            self._warm_up_followers()
+            
+            # Start order update workers before any event can arrive
+            self.event_workers = [
+                Thread(target=self._event_worker_loop, args=(shard,), daemon=True)
+                for shard in range(_EVENT_WORKERS)
+            ]
+            for worker in self.event_workers:
+                worker.start()
             
-            # Start keepalive thread
-            self.keepalive_thread = Thread(target=self._keepalive_loop, daemon=True)
-            self.keepalive_thread.start()
+            # Create listen key (kept alive from the stream's pong handler)
+            self.listen_key = self.master_client.create_listen_key()
+            self.next_keepalive = time.monotonic() + self.config.websocket.keepalive_interval
             
             # Connect to WebSocket
             self._connect_websocket()
@@ -129,44 +294,98 @@ class FuturesCopyTradeEngine:
         except Exception as e:
             logger.error(f"Failed to start engine: {e}")
             self.is_running = False
+            self.stop_event.set()
+            self._stop_event_workers()
             raise
 
+    def _stop_event_workers(self) -> None:
+        """Stop the running event workers (they exit after draining the updates already queued)."""
+        workers = [(shard, worker) for shard, worker in enumerate(self.event_workers) if worker.is_alive()]
+        for shard, _ in workers:
+            self.event_queues[shard].put(None)
+        for _, worker in workers:
+            worker.join(timeout=5)
+        self.event_workers = []
+
+    def _warm_up_followers(self) -> None:
+        """Open each follower's REST connection and WebSocket API session in parallel."""
+        wait([
+            self.order_executor.submit(self._warm_up_follower, follower)
+            for follower in self._active_followers
+        ])
+
+    def _warm_up_follower(self, follower: _Follower) -> None:
+        """Warm one follower's connections (also caches its balance for the first order)."""
+        try:
+            follower.client.get_balance("USDT")
+        except Exception as e:
+            logger.warning(f"Follower '{follower.name}': REST warm-up failed - {e}")
+        
+        if follower.ws_client is not None:
+            try:
+                follower.ws_client.connect()
+            except WSTradeUnavailableError as e:
+                logger.warning(f"Follower '{follower.name}': {e}, orders will use REST until it reconnects")
+
     def _initialize_accounts(self) -> None:
         """Initialize account settings (leverage, margin type, position mode)."""
         logger.info("Initializing account settings...")
         
         # Get configuration
-        leverage = self.config.trading.get('leverage', 10)
         margin_type = self.config.trading.get('margin_type', 'CROSSED')
-        position_mode = self.config.trading.get('position_mode', 'one_way')  # one_way or hedge
+        position_mode = self._position_mode  # one_way or hedge
+        margin_enum = MarginType.ISOLATED if margin_type == 'ISOLATED' else MarginType.CROSSED
         
         # Set position mode for all accounts
         dual_side = position_mode == 'hedge'
+        accounts = self._all_accounts()
+        calls = [
+            (account, "position mode", client.set_position_mode, (dual_side,))
+            for account, client in accounts
+        ]
         
-        try:
-            self.master_client.set_position_mode(dual_side)
-            logger.info(f"Master: Position mode set to {position_mode}")
-        except Exception as e:
-            logger.warning(f"Master: Failed to set position mode - {e}")
+        # Pre-configure leverage and margin type for symbol-specific settings
+        symbol_leverage = self._symbol_leverage
+        for symbol, lev in symbol_leverage.items():
+            for account, client in accounts:
+                calls.append((account, f"{symbol} leverage", client.set_leverage, (symbol, lev)))
+                calls.append((account, f"{symbol} margin type", client.set_margin_type, (symbol, margin_enum)))
+        
+        logger.info(
+            f"Applying position mode {position_mode} to {len(accounts)} accounts"
+            + (f", leverage/margin ({margin_type}) for {len(symbol_leverage)} symbols" if symbol_leverage else "")
+        )
+        failed = self._configure_accounts(calls)
+        logger.info(f"Account settings applied ({len(calls) - failed}/{len(calls)} succeeded)")
+
+    def _all_accounts(self) -> List[Tuple[str, BinanceFuturesClient]]:
+        """Master and follower clients, labelled for logging."""
+        return [("Master", self.master_client)] + [
+            (f"Follower '{name}'", client) for name, client in self.follower_clients.items()
+        ]
+
+    def _configure_accounts(self, calls: List[Tuple[str, str, Callable, Tuple]]) -> int:
+        """
+        Run account setting calls in parallel on the order pool.
         
-        for name, client in self.follower_clients.items():
+        Args:
+            calls: (account label, setting description, client method, args)
+            
+        Returns:
+            Number of calls that failed (logged together as one warning)
+        """
+        def configure(call: Tuple[str, str, Callable, Tuple]) -> Optional[str]:
+            account, setting, method, args = call
             try:
-                client.set_position_mode(dual_side)
-                logger.info(f"Follower '{name}': Position mode set to {position_mode}")
+                method(*args)
             except Exception as e:
-                logger.warning(f"Follower '{name}': Failed to set position mode - {e}")
+                return f"{account}: {setting} - {e}"
+            return None
         
-        # Pre-configure leverage and margin type for symbol-specific settings
-        symbol_leverage = self.config.trading.get('symbol_leverage', {})
-        if symbol_leverage:
-            logger.info(f"Pre-configuring leverage for {len(symbol_leverage)} symbols...")
-            for symbol, lev in symbol_leverage.items():
-                try:
-                    self.set_symbol_leverage(symbol, lev)
-                    self.set_symbol_margin_type(symbol, margin_type)
-                    logger.info(f"Pre-configured {symbol}: leverage={lev}x, margin={margin_type}")
-                except Exception as e:
-                    logger.warning(f"Failed to pre-configure {symbol}: {e}")
+        failures = [failure for failure in self.order_executor.map(configure, calls) if failure]
+        if failures:
+            logger.warning("Failed to apply %d account setting(s):\n  %s", len(failures), "\n  ".join(failures))
+        return len(failures)
 
     def set_symbol_leverage(self, symbol: str, leverage: int) -> None:
         """
@@ -177,20 +396,10 @@ class FuturesCopyTradeEngine:
             leverage: Leverage (1-125)
         """
         logger.info(f"Setting leverage for {symbol}: {leverage}x")
-        
-        # Set for master
-        try:
-            self.master_client.set_leverage(symbol, leverage)
-        except Exception as e:
-            logger.warning(f"Master: Failed to set leverage - {e}")
-        
-        # Set for followers
-        for name, client in self.follower_clients.items():
-            try:
-                client.set_leverage(symbol, leverage)
-                logger.info(f"Follower '{name}': Leverage set to {leverage}x")
-            except Exception as e:
-                logger.warning(f"Follower '{name}': Failed to set leverage - {e}")
+        self._configure_accounts([
+            (account, f"{symbol} leverage", client.set_leverage, (symbol, leverage))
+            for account, client in self._all_accounts()
+        ])
 
     def set_symbol_margin_type(self, symbol: str, margin_type: str) -> None:
         """
@@ -202,20 +411,10 @@ class FuturesCopyTradeEngine:
         """
         margin_enum = MarginType.ISOLATED if margin_type == 'ISOLATED' else MarginType.CROSSED
         logger.info(f"Setting margin type for {symbol}: {margin_type}")
-        
-        # Set for master
-        try:
-            self.master_client.set_margin_type(symbol, margin_enum)
-        except Exception as e:
-            logger.warning(f"Master: Failed to set margin type - {e}")
-        
-        # Set for followers
-        for name, client in self.follower_clients.items():
-            try:
-                client.set_margin_type(symbol, margin_enum)
-                logger.info(f"Follower '{name}': Margin type set to {margin_type}")
-            except Exception as e:
-                logger.warning(f"Follower '{name}': Failed to set margin type - {e}")
+        self._configure_accounts([
+            (account, f"{symbol} margin type", client.set_margin_type, (symbol, margin_enum))
+            for account, client in self._all_accounts()
+        ])
 
     def stop(self) -> None:
         """Stop the copy trading engine."""
@@ -231,6 +430,15 @@ class FuturesCopyTradeEngine:
         if self.ws:
             self.ws.close()
         
+        self._stop_event_workers()
+        
+        # Orders already submitted finish in the background
+        self.order_executor.shutdown(wait=False)
+        self._order_executor_shut_down = True
+        
+        for ws_client in self.follower_ws_clients.values():
+            ws_client.close()
+        
         if self.listen_key:
             try:
                 self.master_client.close_listen_key(self.listen_key)
@@ -260,23 +468,41 @@ class FuturesCopyTradeEngine:
             on_pong=self._on_pong
         )
         
-        self.ws_thread = Thread(target=self.ws.run_forever, daemon=True)
+        # The JSON decoder rejects malformed UTF-8 itself, so skip
+        # websocket-client's pure-Python per-frame UTF-8 validation
+        self.ws_thread = Thread(
+            target=self.ws.run_forever,
+            kwargs={
+                'skip_utf8_validation': True,
+                'sockopt': _WS_SOCKET_OPTIONS,
+                'ping_interval': _WS_PING_INTERVAL,
+                'ping_timeout': _WS_PING_TIMEOUT
+            },
+            daemon=True
+        )
         self.ws_thread.start()
 
-    def _keepalive_loop(self) -> None:
-        """Periodically ping the listen key to keep it alive."""
-        interval = self.config.websocket.keepalive_interval
+    def _keepalive_if_due(self) -> None:
+        """
+        Keep the listen key alive once keepalive_interval has passed.
         
-        while not self.stop_event.is_set():
-            try:
-                self.stop_event.wait(interval)
-                
-                if not self.stop_event.is_set() and self.listen_key:
-                    self.master_client.keepalive_listen_key(self.listen_key)
-                    logger.debug("Listen key keepalive successful")
-                    
-            except Exception as e:
-                logger.error(f"Listen key keepalive failed: {e}")
+        Called on every pong (each _WS_PING_INTERVAL while connected), so no
+        dedicated timer thread is needed; the REST call runs on the order
+        pool to keep the WebSocket thread reading.
+        """
+        now = time.monotonic()
+        if now < self.next_keepalive or self.stop_event.is_set():
+            return
+        self.next_keepalive = now + self.config.websocket.keepalive_interval
+        self.order_executor.submit(self._keepalive_listen_key, self.listen_key)
+
+    def _keepalive_listen_key(self, listen_key: str) -> None:
+        """Ping the listen key to keep it alive."""
+        try:
+            self.master_client.keepalive_listen_key(listen_key)
+            logger.debug("Listen key keepalive successful")
+        except Exception as e:
+            logger.error(f"Listen key keepalive failed: {e}")
 
     def _on_open(self, ws: websocket.WebSocketApp) -> None:
         """Handle WebSocket connection opened."""
@@ -290,6 +516,7 @@ class FuturesCopyTradeEngine:
     def _on_pong(self, ws: websocket.WebSocketApp, message: str) -> None:
         """Handle WebSocket pong."""
         logger.debug("Received WebSocket pong")
+        self._keepalive_if_due()
 
     def _on_close(self, ws: websocket.WebSocketApp, close_status_code: int, close_msg: str) -> None:
         """Handle WebSocket connection closed."""
@@ -305,99 +532,220 @@ class FuturesCopyTradeEngine:
         logger.error(f"WebSocket error: {error}")
 
     def _attempt_reconnect(self) -> None:
-        """Attempt to reconnect to WebSocket."""
+        """
+        Attempt to reconnect to WebSocket, backing off exponentially (with jitter) between attempts.
+        
+        The backoff follows reconnect_count, which only _on_open resets, so it
+        keeps growing across connections that close again before opening.
+        """
         max_attempts = self.config.websocket.max_reconnect_attempts
-        delay = self.config.websocket.reconnect_delay
+        base_delay = self.config.websocket.reconnect_delay
         
-        if self.reconnect_count >= max_attempts:
-            logger.error(f"Max reconnection attempts ({max_attempts}) reached. Stopping engine.")
-            self.stop()
-            return
+        while self.reconnect_count < max_attempts:
+            if not self.is_running or self.stop_event.is_set():
+                return
+            
+            delay = min(base_delay * 2 ** self.reconnect_count, _MAX_RECONNECT_DELAY)
+            self.reconnect_count += 1
+            # Jitter so clients dropped together don't reconnect in lockstep
+            jittered_delay = delay * random.uniform(1 - _RECONNECT_JITTER, 1 + _RECONNECT_JITTER)
+            logger.info(f"Attempting to reconnect ({self.reconnect_count}/{max_attempts}) in {jittered_delay:.1f}s...")
+            
+            # Wakes immediately if the engine is stopped meanwhile
+            if self.stop_event.wait(jittered_delay):
+                return
+            
+            try:
+                self.listen_key = self.master_client.create_listen_key()
+                self.next_keepalive = time.monotonic() + self.config.websocket.keepalive_interval
+                self._connect_websocket()
+                return
+            except Exception as e:
+                logger.error(f"Reconnection failed: {e}")
         
-        self.reconnect_count += 1
-        logger.info(f"Attempting to reconnect ({self.reconnect_count}/{max_attempts}) in {delay}s...")
+        logger.error(f"Max reconnection attempts ({max_attempts}) reached. Stopping engine.")
+        self.stop()
+
+    def _on_message(self, ws: websocket.WebSocketApp, message: bytes) -> None:
+        """Handle incoming WebSocket messages (raw bytes: UTF-8 validation is skipped)."""
+        if isinstance(message, str):
+            message = message.encode('utf-8')
         
-        time.sleep(delay)
+        # Other events (ACCOUNT_UPDATE etc.) are only ever logged at DEBUG
+        if b'ORDER_TRADE_UPDATE' not in message and not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        # Most order updates are NEW/CANCELED/EXPIRED: drop them before decoding.
+        # Only trusted when the compact "x":" key is present, so a payload
+        # format change falls through to a full parse instead of dropping trades.
+        if (b'"x":"' in message and b'"x":"TRADE"' not in message
+                and b'ORDER_TRADE_UPDATE' in message):
+            return
         
         try:
-            self.listen_key = self.master_client.create_listen_key()
-            self._connect_websocket()
-        except Exception as e:
-            logger.error(f"Reconnection failed: {e}")
-            self._attempt_reconnect()
-
-    def _on_message(self, ws: websocket.WebSocketApp, message: str) -> None:
-        """Handle incoming WebSocket messages."""
-        try:
-            data = json.loads(message)
+            data = _json_loads(message)
             event_type = data.get('e')
             
             if event_type == 'ORDER_TRADE_UPDATE':
-                self._handle_order_update(data)
-            elif event_type == 'ACCOUNT_UPDATE':
-                logger.debug("Received account update")
-            else:
-                logger.debug(f"Received event: {event_type}")
+                # Only parse + enqueue (the order object) here so the socket is never left unread
+                order_data = data.get('o', {})
+                self.event_queues[hash(order_data.get('s')) % _EVENT_WORKERS].put_nowait(order_data)
+            elif logger.isEnabledFor(logging.DEBUG):
+                if event_type == 'ACCOUNT_UPDATE':
+                    logger.debug("Received account update")
+                else:
+                    logger.debug("Received event: %s", event_type)
                 
         except Exception as e:
-            logger.error(f"Error processing message: {e}", exc_info=True)
+            logger.error("Error processing message: %r", e, exc_info=self._should_log_traceback(e))
 
-    def _handle_order_update(self, data: Dict) -> None:
-        """Handle ORDER_TRADE_UPDATE event from Futures."""
-        order_data = data.get('o', {})
+    def _event_worker_loop(self, shard: int) -> None:
+        """Process one shard's queued order updates until a None sentinel is received."""
+        event_queue = self.event_queues[shard]
+        while True:
+            # Take whatever else is already waiting, up to one batch
+            batch = [event_queue.get()]
+            while len(batch) < _MAX_BATCH_ORDERS:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            fills = []
+            for order_data in batch:
+                if order_data is None:
+                    continue
+                try:
+                    fill = self._handle_order_update(order_data, shard)
+                except Exception as e:
+                    logger.error("Error processing order update: %r", e, exc_info=self._should_log_traceback(e))
+                    continue
+                if fill is not None:
+                    fills.append(fill)
+            
+            for group in self._group_by_distinct_symbol(fills):
+                try:
+                    self._replicate_to_followers(group)
+                except Exception as e:
+                    logger.error("Error replicating fills: %r", e, exc_info=self._should_log_traceback(e))
+            
+            if None in batch:
+                return
+
+    @staticmethod
+    def _group_by_distinct_symbol(fills: List[_Fill]) -> List[List[_Fill]]:
+        """
+        Split fills, in order, into groups holding at most one fill per symbol.
         
-        exec_type = order_data.get('x')  # Execution type
-        order_status = order_data.get('X')  # Order status
-        order_id = order_data.get('i')  # Order ID
-        trade_id = order_data.get('t')  # Trade ID
+        Binance executes batchOrders entries concurrently and in no set order,
+        so two fills for one symbol must not share a batch: a second fill for a
+        symbol starts a new group, copied only after the one before it.
+        """
+        groups: List[List[_Fill]] = []
+        group: List[_Fill] = []
+        symbols = set()
+        for fill in fills:
+            if fill.symbol in symbols:
+                groups.append(group)
+                group = []
+                symbols.clear()
+            group.append(fill)
+            symbols.add(fill.symbol)
+        if group:
+            groups.append(group)
+        return groups
+
+    def _should_log_traceback(self, error: Exception) -> bool:
+        """
+        Whether to log this error's traceback (once per kind per interval).
+        
+        Errors are grouped by type and the message text before the first ':',
+        so repeats of one failure only pay for traceback formatting once.
+        """
+        key = (type(error).__name__, str(error).split(':', 1)[0])
+        now = time.monotonic()
+        logged_at = self._traceback_logged_at
+        with self._traceback_lock:
+            last_logged = logged_at.get(key)
+            if last_logged is not None and now - last_logged < _TRACEBACK_LOG_INTERVAL:
+                return False
+            # Re-insert so the dict stays ordered by time logged
+            logged_at.pop(key, None)
+            logged_at[key] = now
+            # Expired entries act like missing ones: drop them from the front,
+            # along with the oldest beyond the cap
+            while True:
+                oldest_key = next(iter(logged_at))
+                if now - logged_at[oldest_key] < _TRACEBACK_LOG_INTERVAL and len(logged_at) <= _MAX_TRACEBACK_KEYS:
+                    break
+                del logged_at[oldest_key]
+        return True
+
+    def _handle_order_update(self, order_data: Dict, shard: int = 0) -> Optional[_Fill]:
+        """
+        Handle ORDER_TRADE_UPDATE event from Futures.
         
-        # Only process trades
-        if exec_type != 'TRADE':
+        Args:
+            order_data: The event's order object ('o')
+            shard: Event worker handling it (selects the dedup shard)
+        
+        Returns:
+            The fill to copy, or None if the update is not a new, allowed trade
+        """
+        # Only process trades (checked before extracting anything else)
+        if order_data.get('x') != 'TRADE':
+            return
+        
+        try:
+            (order_status, order_id, trade_id, symbol, side, order_type,
+             last_qty, last_price, cumulative_qty, total_qty) = _ORDER_FIELDS(order_data)
+        except KeyError as e:
+            logger.warning("Ignoring order update missing field %s", e)
             return
         
         # Deduplication with timestamp-based cleanup
-        trade_key = f"{order_id}_{trade_id}"
-        current_time = time.time()
-        
-        with self.order_lock:
-            # Clean up old entries (older than 1 hour)
-            expired_keys = [k for k, t in self.processed_orders.items() 
-                           if current_time - t > 3600]
-            for k in expired_keys:
-                del self.processed_orders[k]
-            
-            # Check for duplicate
-            if trade_key in self.processed_orders:
-                logger.debug(f"Duplicate trade detected: {trade_key}, skipping")
-                self.stats['duplicate_filtered'] += 1
-                return
-            
-            # Record this trade
-            self.processed_orders[trade_key] = current_time
+        trade_key = (order_id, trade_id)
+        current_time = time.monotonic()
+        processed = self.processed_orders[shard]
         
-        symbol = order_data['s']
-        side = order_data['S']
-        position_side = order_data.get('ps', 'BOTH')
-        order_type = order_data['o']
+        # Clean up old entries (oldest first, stop at the first fresh one)
+        fifo = self.processed_order_fifos[shard]
+        expire_before = current_time - self.processed_order_ttl
+        while fifo and fifo[0][0] < expire_before:
+            processed.discard(fifo.popleft()[1])
+        
+        # Check for duplicate
+        if trade_key in processed:
+            logger.debug("Duplicate trade detected: %s_%s, skipping", order_id, trade_id)
+            self._stats().duplicate_filtered += 1
+            return
         
-        # Last executed quantity
-        last_exec_qty = float(order_data['l'])
-        last_exec_price = float(order_data['L'])
+        # Record this trade
+        processed.add(trade_key)
+        fifo.append((current_time, trade_key))
         
-        # Cumulative filled quantity
-        cumulative_qty = float(order_data['z'])
-        total_qty = float(order_data['q'])
+        symbol = sys.intern(symbol)
+        position_side = order_data.get('ps', 'BOTH')
         
         # Check if symbol is allowed
         if not self._is_symbol_allowed(symbol):
-            logger.info(f"Symbol {symbol} is filtered out, skipping")
+            logger.info("Symbol %s is filtered out, skipping", symbol)
             return
         
+        # Last executed quantity/price are the only numbers used downstream;
+        # cumulative/total quantity are only logged, as Binance sent them
+        last_exec_qty = float(last_qty)
+        last_exec_price = float(last_price)
+        
         # Log with fill status
-        fill_status = "FILLED" if order_status == 'FILLED' else f"PARTIAL ({cumulative_qty}/{total_qty})"
-        logger.info(f"📊 Master {fill_status}: {side} {last_exec_qty} {symbol} @ {last_exec_price} [{position_side}]")
+        if order_status == 'FILLED':
+            logger.info("📊 Master FILLED: %s %s %s @ %s [%s]",
+                        side, last_exec_qty, symbol, last_exec_price, position_side)
+        else:
+            logger.info("📊 Master PARTIAL (%s/%s): %s %s %s @ %s [%s]",
+                        cumulative_qty, total_qty, side, last_exec_qty, symbol, last_exec_price, position_side)
         
-        self.stats['total_trades'] += 1
+        self._stats().total_trades += 1
         
         # Log master trade
         self.trade_logger.log_master_trade(
@@ -410,56 +758,61 @@ class FuturesCopyTradeEngine:
             trade_id=trade_id
         )
         
-        # Replicate to followers
-        self._replicate_to_followers(symbol, side, last_exec_qty, last_exec_price, position_side)
+        return _Fill(symbol, side, last_exec_qty, last_exec_price, position_side)
 
     def _is_symbol_allowed(self, symbol: str) -> bool:
-        """Check if symbol is allowed for copy trading."""
-        if symbol in self.config.trading.excluded_symbols:
-            return False
-        
-        if self.config.trading.allowed_symbols:
-            return symbol in self.config.trading.allowed_symbols
-        
-        return True
+        """Check if symbol is allowed for copy trading (one dict lookup once seen)."""
+        allowed = self._symbol_policy.get(symbol)
+        if allowed is None:
+            allowed = symbol not in self._excluded_symbols and (
+                self._allowed_symbols is None or symbol in self._allowed_symbols
+            )
+            self._symbol_policy[symbol] = allowed
+        return allowed
 
-    def _replicate_to_followers(
-        self,
-        symbol: str,
-        side: str,
-        quantity: float,
-        price: float,
-        position_side: str
-    ) -> None:
-        """Replicate trade to all follower accounts."""
-        for follower in self.config.followers:
-            if not follower.enabled:
-                continue
-            
-            if follower.name not in self.follower_clients:
-                continue
-            
-            # Calculate follower quantity with scale
-            follower_qty = quantity * follower.scale
-            
-            # Apply quantity limits
-            if follower_qty < self.config.trading.min_order_quantity:
-                logger.warning(f"Follower {follower.name}: quantity {follower_qty} below minimum, skipping")
-                continue
-            
-            if follower_qty > self.config.trading.max_order_quantity:
-                logger.warning(f"Follower {follower.name}: quantity {follower_qty} above maximum, capping")
-                follower_qty = self.config.trading.max_order_quantity
+    def _replicate_to_followers(self, fills: List[_Fill]) -> None:
+        """Replicate fills to all follower accounts (followers in parallel)."""
+        min_qty = self._min_order_quantity
+        max_qty = self._max_order_quantity
+        jobs = []
+        for follower in self._active_followers:
+            scale = follower.scale
+            orders = []
+            for fill in fills:
+                # Calculate follower quantity with scale
+                follower_qty = fill.quantity * scale
+                
+                # Apply quantity limits
+                if follower_qty < min_qty:
+                    logger.warning("Follower %s: quantity %s below minimum, skipping", follower.name, follower_qty)
+                    continue
+                
+                if follower_qty > max_qty:
+                    logger.warning("Follower %s: quantity %s above maximum, capping", follower.name, follower_qty)
+                    follower_qty = max_qty
+                
+                orders.append(fill._replace(quantity=follower_qty))
             
-            # Place order for follower
-            self._place_follower_order(
-                follower_name=follower.name,
-                symbol=symbol,
-                side=side,
-                quantity=follower_qty,
-                price=price,
-                position_side=position_side
-            )
+            if orders:
+                jobs.append((follower, orders))
+        
+        if not jobs:
+            return
+        
+        notional_prices = self._get_notional_prices(fills)
+        
+        # Hand the other followers to the pool, but place the first one on this
+        # thread: it would otherwise just block in wait() while a pool thread
+        # is woken for the same work
+        futures = [
+            self.order_executor.submit(self._place_follower_orders, follower, orders, notional_prices)
+            for follower, orders in jobs[1:]
+        ]
+        self._place_follower_orders(*jobs[0], notional_prices)
+        
+        # Wait for all followers so the next fill on this symbol is copied after these
+        if futures:
+            wait(futures)
 
     def _check_balance(self, client: BinanceFuturesClient, symbol: str, quantity: float, price: float, leverage: int) -> bool:
         """
@@ -476,181 +829,333 @@ class FuturesCopyTradeEngine:
             True if sufficient balance, False otherwise
         """
         try:
-            # Get available balance (USDT)
-            available_balance = client.get_balance("USDT")
+            # Get available balance (USDT, from the client's cached account snapshot)
+            available_balance = float(client.get_balance("USDT"))
             
-            # Calculate required margin
-            order_value = Decimal(str(quantity)) * Decimal(str(price))
-            required_margin = order_value / Decimal(str(leverage))
-            
-            # Add 5% buffer for fees
-            required_margin = required_margin * Decimal('1.05')
+            # Calculate required margin. Plain float math: this is only a
+            # pre-flight estimate (Binance checks margin exactly) and the 5%
+            # fee buffer dwarfs any rounding error.
+            required_margin = quantity * price / leverage * 1.05
             
             if available_balance < required_margin:
-                logger.warning(f"Insufficient balance: available={available_balance}, required={required_margin}")
+                logger.warning("Insufficient balance: available=%s, required=%.8f", available_balance, required_margin)
                 return False
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to check balance: {e}")
+            logger.error("Failed to check balance: %s", e)
             return False
 
-    def _place_follower_order(
+    def _get_notional_prices(self, fills: List[_Fill]) -> Dict[str, float]:
+        """
+        Get the price each symbol's MIN_NOTIONAL check uses.
+        
+        MARKET orders are checked against the current mark price, fetched
+        once per symbol here and shared by all followers (it is public data).
+        LIMIT orders are checked against their own price, so the map is empty.
+        """
+        notional_prices: Dict[str, float] = {}
+        if self._follower_order_type != 'MARKET':
+            return notional_prices
+        
+        for fill in fills:
+            if fill.symbol in notional_prices:
+                continue
+            try:
+                notional_prices[fill.symbol] = float(self.master_client.get_mark_price(fill.symbol))
+            except Exception as e:
+                logger.warning("Failed to get mark price for %s, using execution price: %s", fill.symbol, e)
+                notional_prices[fill.symbol] = fill.price
+        return notional_prices
+
+    def _place_follower_orders(
+        self,
+        follower: _Follower,
+        orders: List[_Fill],
+        notional_prices: Dict[str, float]
+    ) -> None:
+        """Place one follower's orders: singly, or as one batchOrders request."""
+        if len(orders) == 1:
+            self._place_follower_order(follower, *orders[0], notional_prices=notional_prices)
+        else:
+            self._place_follower_batch(follower, orders, notional_prices)
+
+    def _to_position_side(self, position_side: str) -> PositionSide:
+        """Convert the master's position side for the follower's position mode."""
+        if self._position_mode == 'one_way':
+            return PositionSide.BOTH
+        # Hedge mode: use the position side from master
+        return _POSITION_SIDES.get(position_side, PositionSide.BOTH)
+
+    def _passes_order_checks(
         self,
         follower_name: str,
+        client: BinanceFuturesClient,
+        symbol: str,
+        quantity: float,
+        price: float,
+        notional_price: float
+    ) -> bool:
+        """Check balance and MIN_NOTIONAL (at notional_price) before placing a follower order."""
+        # Check balance before placing order
+        leverage = self._symbol_leverage.get(symbol, self._leverage)
+        if not self._check_balance(client, symbol, quantity, price, leverage):
+            logger.error("✗ Follower '%s': Insufficient balance for %s %s", follower_name, quantity, symbol)
+            stats = self._stats()
+            stats.insufficient_balance += 1
+            stats.failed_copies += 1
+            return False
+        
+        # Check MIN_NOTIONAL for all order types
+        if not client.check_min_notional(symbol, quantity, notional_price):
+            logger.error("✗ Follower '%s': Order value too small. MIN_NOTIONAL: %s",
+                         follower_name, client.get_min_notional(symbol))
+            stats = self._stats()
+            stats.min_notional_rejected += 1
+            stats.failed_copies += 1
+            return False
+        
+        return True
+
+    def _record_follower_success(self, follower_name: str, order: _Fill, result: Dict) -> None:
+        """Log, count and persist a placed follower order."""
+        order_type = self._follower_order_type
+        order_id = result.get('orderId')
+        executed_qty = result.get('executedQty', 0)
+        status = result.get('status')
+        
+        logger.info("✓ Follower '%s': %s %s/%s %s - orderId=%s, status=%s, positionSide=%s",
+                    follower_name, order.side, executed_qty, order.quantity, order.symbol,
+                    order_id, status, order.position_side)
+        
+        self._stats().successful_copies += 1
+        
+        # Log follower trade
+        self.trade_logger.log_follower_trade(
+            follower_name=follower_name,
+            symbol=order.symbol,
+            side=order.side,
+            quantity=order.quantity,
+            price=order.price if order_type == 'LIMIT' else None,
+            position_side=order.position_side,
+            order_type=order_type,
+            status=status,
+            order_id=order_id
+        )
+
+    def _record_follower_failure(self, follower_name: str, symbol: str, error: Exception) -> None:
+        """Log, count and persist a failed follower order by error kind."""
+        if isinstance(error, ValueError):
+            logger.error("✗ Follower '%s': Invalid parameters - %s", follower_name, error)
+            self.trade_logger.log_error(follower_name, symbol, 'validation', str(error))
+        elif isinstance(error, BinanceAPIError):
+            error_str = str(error)
+            if 'insufficient balance' in error_str.lower():
+                logger.error("✗ Follower '%s': Insufficient balance", follower_name)
+                self._stats().insufficient_balance += 1
+                self.trade_logger.log_error(follower_name, symbol, 'insufficient_balance', error_str)
+            elif 'min notional' in error_str.lower():
+                logger.error("✗ Follower '%s': Order value too small (MIN_NOTIONAL)", follower_name)
+                self._stats().min_notional_rejected += 1
+                self.trade_logger.log_error(follower_name, symbol, 'min_notional', error_str)
+            else:
+                logger.error("✗ Follower '%s': API error - %s", follower_name, error)
+                self.trade_logger.log_error(follower_name, symbol, 'api_error', error_str)
+        else:
+            logger.error("✗ Follower '%s': Unexpected error - %r", follower_name, error,
+                         exc_info=self._should_log_traceback(error))
+            self.trade_logger.log_error(follower_name, symbol, 'unexpected', str(error))
+        self._stats().failed_copies += 1
+
+    def _place_follower_order(
+        self,
+        follower: _Follower,
         symbol: str,
         side: str,
         quantity: float,
         price: float,
-        position_side: str
+        position_side: str,
+        notional_prices: Dict[str, float]
     ) -> None:
         """Place order for a specific follower account."""
-        client = self.follower_clients.get(follower_name)
-        if not client:
-            logger.error(f"Follower client not found: {follower_name}")
-            return
-        
-        # Get circuit breaker for this follower
-        breaker = self.circuit_breaker_manager.get_breaker(f"follower_{follower_name}")
+        follower_name = follower.name
+        client = follower.client
+        breaker = follower.breaker
         
         # Check circuit breaker state
         try:
             breaker.call(lambda: None)  # Test if circuit is open
         except Exception as e:
-            logger.error(f"✗ Follower '{follower_name}': Circuit breaker is OPEN - {e}")
-            self.stats['failed_copies'] += 1
+            logger.error("✗ Follower '%s': Circuit breaker is OPEN - %s", follower_name, e)
+            self._stats().failed_copies += 1
             return
         
         # Use balance lock for concurrent safety
-        with self.follower_balance_locks[follower_name]:
-            order_type = self.config.trading.follower_order_type
-            leverage = self.config.trading.get('leverage', 10)
-            
-            # Convert position side
-            position_mode = self.config.trading.get('position_mode', 'one_way')
-            if position_mode == 'one_way':
-                pos_side = PositionSide.BOTH
-            else:
-                # Hedge mode: use the position side from master
-                if position_side == 'LONG':
-                    pos_side = PositionSide.LONG
-                elif position_side == 'SHORT':
-                    pos_side = PositionSide.SHORT
-                else:
-                    pos_side = PositionSide.BOTH
+        with follower.balance_lock:
+            order_type = self._follower_order_type
+            pos_side = self._to_position_side(position_side)
             
             try:
-                # Check balance before placing order
-                if not self._check_balance(client, symbol, quantity, price, leverage):
-                    logger.error(f"✗ Follower '{follower_name}': Insufficient balance for {quantity} {symbol}")
-                    self.stats['insufficient_balance'] += 1
-                    self.stats['failed_copies'] += 1
+                notional_price = notional_prices.get(symbol, price)
+                if not self._passes_order_checks(follower_name, client, symbol, quantity, price, notional_price):
                     return
                 
-                # Check MIN_NOTIONAL for all order types
-                check_price = price
-                if order_type == 'MARKET':
-                    # For MARKET orders, use current mark price to estimate
+                # Place order, over the WebSocket API when it is available
+                result = None
+                ws_client = follower.ws_client
+                if ws_client is not None:
+                    start_ns = time.perf_counter_ns()
                     try:
-                        check_price = float(client.get_mark_price(symbol))
-                    except Exception as e:
-                        logger.warning(f"Failed to get mark price for {symbol}, using execution price: {e}")
-                        check_price = price
+                        result = ws_client.place_order(
+                            symbol=symbol,
+                            side=side,
+                            order_type=order_type,
+                            quantity=quantity,
+                            price=price if order_type == 'LIMIT' else None,
+                            position_side=pos_side
+                        )
+                    except WSTradeUnavailableError as e:
+                        logger.warning("Follower '%s': %s, falling back to REST", follower_name, e)
+                    else:
+                        ack_time_ns = time.perf_counter_ns() - start_ns
+                        stats = self._stats()
+                        stats.ws_orders += 1
+                        stats.ws_ack_time_ns += ack_time_ns
                 
-                if not client.check_min_notional(symbol, quantity, check_price):
-                    filters = client.get_symbol_filters(symbol)
-                    min_notional = filters.get('MIN_NOTIONAL', {}).get('notional', 'N/A')
-                    logger.error(f"✗ Follower '{follower_name}': Order value too small. MIN_NOTIONAL: {min_notional}")
-                    self.stats['min_notional_rejected'] += 1
-                    self.stats['failed_copies'] += 1
-                    return
+                if result is None:
+                    result = client.place_order(
+                        symbol=symbol,
+                        side=side,
+                        order_type=order_type,
+                        quantity=quantity,
+                        price=price if order_type == 'LIMIT' else None,
+                        position_side=pos_side
+                    )
                 
-                # Place order
-                result = client.place_order(
-                    symbol=symbol,
-                    side=side,
-                    order_type=order_type,
-                    quantity=quantity,
-                    price=price if order_type == 'LIMIT' else None,
-                    position_side=pos_side
+                self._record_follower_success(
+                    follower_name, _Fill(symbol, side, quantity, price, position_side), result
                 )
-                
-                # Log detailed order info
-                order_id = result.get('orderId')
-                executed_qty = result.get('executedQty', 0)
-                status = result.get('status')
-                
-                logger.info(f"✓ Follower '{follower_name}': {side} {executed_qty}/{quantity} {symbol} - "
-                           f"orderId={order_id}, status={status}, positionSide={position_side}")
-                
-                self.stats['successful_copies'] += 1
                 breaker._on_success()  # Notify circuit breaker of success
                 
-                # Log follower trade
-                self.trade_logger.log_follower_trade(
-                    follower_name=follower_name,
-                    symbol=symbol,
-                    side=side,
-                    quantity=quantity,
-                    price=price if order_type == 'LIMIT' else None,
-                    position_side=position_side,
-                    order_type=order_type,
-                    status=status,
-                    order_id=order_id
-                )
-                
-            except ValueError as e:
-                logger.error(f"✗ Follower '{follower_name}': Invalid parameters - {e}")
-                self.stats['failed_copies'] += 1
-                breaker._on_failure(e)  # Notify circuit breaker of failure
-                self.trade_logger.log_error(follower_name, symbol, 'validation', str(e))
-            except BinanceAPIError as e:
-                error_str = str(e)
-                if 'insufficient balance' in error_str.lower():
-                    logger.error(f"✗ Follower '{follower_name}': Insufficient balance")
-                    self.stats['insufficient_balance'] += 1
-                    self.trade_logger.log_error(follower_name, symbol, 'insufficient_balance', error_str)
-                elif 'min notional' in error_str.lower():
-                    logger.error(f"✗ Follower '{follower_name}': Order value too small (MIN_NOTIONAL)")
-                    self.stats['min_notional_rejected'] += 1
-                    self.trade_logger.log_error(follower_name, symbol, 'min_notional', error_str)
-                else:
-                    logger.error(f"✗ Follower '{follower_name}': API error - {e}")
-                    self.trade_logger.log_error(follower_name, symbol, 'api_error', error_str)
-                self.stats['failed_copies'] += 1
+            except Exception as e:
+                self._record_follower_failure(follower_name, symbol, e)
                 breaker._on_failure(e)  # Notify circuit breaker of failure
+
+    def _place_follower_batch(
+        self,
+        follower: _Follower,
+        orders: List[_Fill],
+        notional_prices: Dict[str, float]
+    ) -> None:
+        """Place several orders for one follower in a single batchOrders request."""
+        follower_name = follower.name
+        client = follower.client
+        breaker = follower.breaker
+        
+        try:
+            breaker.call(lambda: None)  # Test if circuit is open
+        except Exception as e:
+            logger.error("✗ Follower '%s': Circuit breaker is OPEN - %s", follower_name, e)
+            self._stats().failed_copies += len(orders)
+            return
+        
+        with follower.balance_lock:
+            order_type = self._follower_order_type
+            batch = []
+            placed = []
+            for order in orders:
+                # Round and check each order on its own, so one invalid order
+                # is dropped here instead of failing the whole batch
+                try:
+                    quantity = client.adjust_quantity_precision(order.symbol, order.quantity)
+                    price = client.adjust_price_precision(order.symbol, order.price) if order_type == 'LIMIT' else None
+                    notional_price = notional_prices.get(order.symbol, order.price)
+                    if not self._passes_order_checks(
+                        follower_name, client, order.symbol, float(quantity), order.price, notional_price
+                    ):
+                        continue
+                except Exception as e:
+                    self._record_follower_failure(follower_name, order.symbol, e)
+                    continue
+                
+                order_params = {
+                    'symbol': order.symbol,
+                    'side': order.side,
+                    'type': order_type,
+                    'quantity': quantity,
+                    'positionSide': self._to_position_side(order.position_side).value
+                }
+                if price is not None:
+                    order_params['price'] = price
+                batch.append(order_params)
+                placed.append(order)
+            
+            if not batch:
+                return
+            
+            try:
+                results = client.place_batch_orders(batch)
             except Exception as e:
-                logger.error(f"✗ Follower '{follower_name}': Unexpected error - {e}", exc_info=True)
-                self.stats['failed_copies'] += 1
+                for order in placed:
+                    self._record_follower_failure(follower_name, order.symbol, e)
                 breaker._on_failure(e)  # Notify circuit breaker of failure
-                self.trade_logger.log_error(follower_name, symbol, 'unexpected', str(e))
+                return
+            
+            # Results are per order, in request order; rejected ones carry
+            # code/msg and are recorded on their own without failing the rest
+            for index, order in enumerate(placed):
+                if index < len(results):
+                    result = results[index]
+                else:
+                    result = {'code': None, 'msg': 'missing from batch response'}
+                if 'code' in result:
+                    error = BinanceAPIError(f"Binance API error [{result['code']}]: {result.get('msg')}")
+                    self._record_follower_failure(follower_name, order.symbol, error)
+                    breaker._on_failure(error)
+                else:
+                    self._record_follower_success(follower_name, order, result)
+                    breaker._on_success()
+
+    def _stats(self) -> _StatsCounters:
+        """This thread's counters, registered on first use."""
+        try:
+            return self._stats_local.counters
+        except AttributeError:
+            counters = self._stats_local.counters = _StatsCounters()
+            with self._stats_shards_lock:
+                self._stats_shards.append(counters)
+            return counters
 
     def _print_statistics(self) -> None:
         """Print trading statistics."""
-        if self.stats['start_time']:
-            runtime = datetime.now() - self.stats['start_time']
+        if self.start_time:
+            stats = self.get_statistics()
+            runtime = timedelta(seconds=time.monotonic() - self.start_monotonic)
             logger.info("=" * 60)
             logger.info("FUTURES COPY TRADING STATISTICS")
             logger.info("=" * 60)
             logger.info(f"Runtime: {runtime}")
-            logger.info(f"Total master trades: {self.stats['total_trades']}")
-            logger.info(f"Successful copies: {self.stats['successful_copies']}")
-            logger.info(f"Failed copies: {self.stats['failed_copies']}")
-            logger.info(f"  - Insufficient balance: {self.stats['insufficient_balance']}")
-            logger.info(f"  - MIN_NOTIONAL rejected: {self.stats['min_notional_rejected']}")
-            logger.info(f"Duplicates filtered: {self.stats['duplicate_filtered']}")
+            logger.info(f"Total master trades: {stats['total_trades']}")
+            logger.info(f"Successful copies: {stats['successful_copies']}")
+            logger.info(f"Failed copies: {stats['failed_copies']}")
+            logger.info(f"  - Insufficient balance: {stats['insufficient_balance']}")
+            logger.info(f"  - MIN_NOTIONAL rejected: {stats['min_notional_rejected']}")
+            logger.info(f"Duplicates filtered: {stats['duplicate_filtered']}")
+            if stats['ws_orders'] > 0:
+                avg_ack_ms = stats['ws_ack_time_ns'] / stats['ws_orders'] / 1e6
+                logger.info(f"WebSocket API orders: {stats['ws_orders']} (avg ack {avg_ack_ms:.1f}ms)")
             
-            total_attempts = self.stats['successful_copies'] + self.stats['failed_copies']
+            total_attempts = stats['successful_copies'] + stats['failed_copies']
             if total_attempts > 0:
-                success_rate = (self.stats['successful_copies'] / total_attempts) * 100
+                success_rate = (stats['successful_copies'] / total_attempts) * 100
                 logger.info(f"Success rate: {success_rate:.2f}%")
             
             # Circuit breaker statistics
             logger.info("-" * 60)
             logger.info("Circuit Breaker Status:")
-            for name, stats in self.circuit_breaker_manager.get_all_statistics().items():
-                logger.info(f"  {name}: {stats['state']} (success_rate: {stats['success_rate']:.1f}%)")
+            for name, breaker_stats in self.circuit_breaker_manager.get_all_statistics().items():
+                logger.info(f"  {name}: {breaker_stats['state']} (success_rate: {breaker_stats['success_rate']:.1f}%)")
             
             # Rate limit statistics
             logger.info("-" * 60)
@@ -666,5 +1171,13 @@ class FuturesCopyTradeEngine:
             logger.info("=" * 60)
 
     def get_statistics(self) -> Dict:
-        """Get current trading statistics."""
-        return self.stats.copy()
+        """Get current trading statistics (summed over all threads' counters)."""
+        with self._stats_shards_lock:
+            shards = list(self._stats_shards)
+        
+        stats: Dict = {
+            name: sum(getattr(shard, name) for shard in shards)
+            for name in _StatsCounters.__slots__
+        }
+        stats['start_time'] = self.start_time
+        return stats
@@ -1,20 +1,137 @@
 """Logging configuration for the copy trading bot."""
 
 import os
+import time
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
 
 from .config_loader import LoggingConfig
 
 
+# Log file writes are batched: flushed at this size, after this long, or on ERROR
+LOG_BUFFER_SIZE = 64 * 1024  # characters
+LOG_FLUSH_INTERVAL = 0.25  # seconds
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes formatted records in batches.
+    
+    Records are buffered and written with a single write() once the buffer
+    reaches buffer_size, flush_interval has passed since the last write, or
+    a record of level ERROR or above arrives (so failures reach disk at once).
+    Rotation still happens before the file would exceed maxBytes.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        buffer_size: int = LOG_BUFFER_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        **kwargs
+    ) -> None:
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Log file path
+            buffer_size: Buffered characters that trigger a write
+            flush_interval: Seconds after which buffered records are written
+            **kwargs: Passed to RotatingFileHandler (maxBytes, backupCount, ...)
+        """
+        super().__init__(filename, **kwargs)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record, rotating and writing as needed."""
+        try:
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.stream.tell() + self._buffered + len(msg) >= self.maxBytes:
+                    self.flush()
+                    self.doRollover()
+            
+            self._buffer.append(msg)
+            self._buffered += len(msg)
+            
+            if (record.levelno >= logging.ERROR or self._buffered >= self.buffer_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self.acquire()
+        try:
+            if self._buffer:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(''.join(self._buffer))
+                self._buffer.clear()
+                self._buffered = 0
+            self._last_flush = time.monotonic()
+            super().flush()
+        finally:
+            self.release()
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue goes idle."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Wait for the next record, flushing buffered output every LOG_FLUSH_INTERVAL meanwhile."""
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
+# Writes records to the real handlers on its own thread (see setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Write out any queued log records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+
+
+# Flush queued records on interpreter exit (runs before logging's own shutdown)
+atexit.register(stop_logging)
+
+
 def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     """
     Setup logging configuration.
     
+    Logging threads only enqueue records; file and console output happen on
+    a listener thread, so a slow disk or terminal never stalls order copying.
+    
     Args:
         config: Logging configuration object. If None, uses default settings.
     """
+    global _queue_listener
+    
     if config is None:
         # Default configuration
         level = logging.INFO
@@ -29,10 +146,10 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
         backup_count = config.backup_count
         console_output = config.console_output
     
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    # Resolve the log path once (handles '~'), then create its directory
+    # in one call that also tolerates it appearing concurrently
+    log_file = os.path.abspath(os.path.expanduser(log_file))
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -45,28 +162,37 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     root_logger.setLevel(level)
     
     # Remove existing handlers
+    stop_logging()
     root_logger.handlers.clear()
+    handlers = []
     
-    # Add file handler with rotation
-    file_handler = RotatingFileHandler(
+    # Add file handler with rotation and batched writes (the file is opened on the first record)
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
     
     # Add console handler if enabled
     if console_output:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Route every record through an unbounded queue to the listener thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = _FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
-    # Reduce noise from websocket library
-    logging.getLogger('websocket').setLevel(logging.WARNING)
+    # Reduce noise from websocket library (it logs per ping/frame below ERROR)
+    logging.getLogger('websocket').setLevel(logging.ERROR)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     
     logging.info("Logging configured successfully")
@@ -38,8 +38,8 @@ class RateLimiter:
         self.safety_margin = safety_margin
         self.effective_limit = int(weight_limit * safety_margin)
         
-        # Track weight usage with timestamps
-        self.weight_history: deque = deque()  # [(timestamp, weight), ...]
+        # Track weight usage with monotonic timestamps (immune to wall-clock steps)
+        self.weight_history: deque = deque()  # [(monotonic_time, weight), ...]
         self.lock = Lock()
         
         # Statistics
@@ -73,7 +73,7 @@ class RateLimiter:
             Time waited in seconds
         """
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             current_weight = self._get_current_weight(current_time)
             
             # Check if we need to wait
@@ -93,7 +93,7 @@ class RateLimiter:
                         )
                         
                         time.sleep(wait_time)
-                        current_time = time.time()
+                        current_time = time.monotonic()
                         self._cleanup_old_entries(current_time)
                         
                         return wait_time
@@ -120,13 +120,14 @@ class RateLimiter:
                 server_weight = int(used_weight_header)
                 
                 with self.lock:
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     current_weight = self._get_current_weight(current_time)
                     
                     # If server reports higher weight, adjust our tracking
                     if server_weight > current_weight:
                         diff = server_weight - current_weight
-                        logger.debug(f"Adjusting weight tracking: +{diff} (server={server_weight}, local={current_weight})")
+                        logger.debug("Adjusting weight tracking: +%s (server=%s, local=%s)",
+                                     diff, server_weight, current_weight)
                         self.weight_history.append((current_time, diff))
                     
                     # Warn if approaching limit
@@ -141,7 +142,7 @@ class RateLimiter:
     def get_statistics(self) -> Dict[str, any]:
         """Get rate limiter statistics."""
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             current_weight = self._get_current_weight(current_time)
             
             return {
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from src import binance_futures_client
+from src.binance_futures_client import BinanceFuturesClient, PositionSide
+
+
+SYMBOLS = {
+    "BTCUSDT": {
+        "symbol": "BTCUSDT",
+        "filters": [
+            {"filterType": "PRICE_FILTER", "tickSize": "0.10", "minPrice": "556.80", "maxPrice": "4529764"},
+            {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001", "maxQty": "1000"},
+            {"filterType": "MIN_NOTIONAL", "notional": "100"},
+        ],
+    }
+}
+
+_sync_time = BinanceFuturesClient._sync_time
+
+
+class FakeTimeHttp:
+    """Answers /fapi/v1/time with a fixed server time."""
+
+    status = 200
+    reason = "OK"
+
+    def __init__(self, server_time):
+        self.data = f'{{"serverTime": {server_time}}}'.encode()
+
+    def request(self, method, url, **kwargs):
+        return self
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(BinanceFuturesClient, "_sync_time", lambda self: None)
+    monkeypatch.setattr(BinanceFuturesClient, "_start_time_sync_thread", lambda self: None)
+    monkeypatch.setattr(binance_futures_client, "_SYMBOL_DISK_CACHE_DIR", str(tmp_path / "cache"))
+    return BinanceFuturesClient("api-key", "api-secret", base_url=f"https://test-{tmp_path.name}.invalid")
+
+
+@pytest.fixture
+def btc_client(client):
+    client._cache_symbol_info(SYMBOLS["BTCUSDT"])
+    return client
+
+
+def test_step_rule_units_round_trip():
+    rule = binance_futures_client._build_step_rule("0.001", "0.001", "1000")
+    assert (rule.precision, rule.step, rule.min_units, rule.max_units) == (3, 1, 1, 1_000_000)
+
+    assert binance_futures_client._to_units(0.3, rule) == 300  # not 0.29999...
+    assert binance_futures_client._to_units(1.23456, rule) == 1234
+    assert binance_futures_client._to_units(1e-05, rule) == 0
+    assert binance_futures_client._format_units(10, rule) == "0.010"
+
+    whole_rule = binance_futures_client._build_step_rule("1", "1", "100")
+    assert binance_futures_client._format_units(7, whole_rule) == "7"
+
+
+def test_adjust_quantity_precision(btc_client):
+    assert btc_client.adjust_quantity_precision("BTCUSDT", 0.0123456) == "0.012"
+    assert btc_client.adjust_quantity_precision("BTCUSDT", 0.3) == "0.300"
+    assert btc_client.adjust_quantity_precision("BTCUSDT", 5000) == "1000.000"
+    with pytest.raises(ValueError):
+        btc_client.adjust_quantity_precision("BTCUSDT", 0.0004)
+
+
+def test_adjust_price_precision_rounds_down_to_tick(btc_client):
+    assert btc_client.adjust_price_precision("BTCUSDT", 30000.57) == "30000.50"
+    with pytest.raises(ValueError):
+        btc_client.adjust_price_precision("BTCUSDT", 100.0)
+
+
+def test_check_min_notional(btc_client):
+    assert btc_client.get_min_notional("BTCUSDT") == Decimal("100")
+    assert btc_client.check_min_notional("BTCUSDT", 0.004, 25000.0)
+    assert not btc_client.check_min_notional("BTCUSDT", 0.003, 25000.0)
+
+
+
+@pytest.mark.parametrize("order_type, price", [("MARKET", None), ("LIMIT", 30000.0)])
+def test_order_prefix_cached_signature_matches_full_query_signature(btc_client, monkeypatch, order_type, price):
+    requests = []
+    monkeypatch.setattr(btc_client, "_request_signed", lambda *args, **kwargs: requests.append(kwargs) or {})
+
+    # The second order reuses the cached prefix and its HMAC state
+    for _ in range(2):
+        btc_client.place_order("BTCUSDT", "BUY", order_type, 0.01, price, position_side=PositionSide.LONG)
+
+    for request in requests:
+        signed_prefix = request["signed_prefix"]
+        assert request["query"].startswith(signed_prefix[0])
+        full_query = f"{request['query']}&timestamp=1700000000000"
+        expected = hmac.new(b"api-secret", full_query.encode("ascii"), hashlib.sha256).hexdigest()
+        assert btc_client._signature(full_query, signed_prefix) == expected
+        assert btc_client._signature(full_query) == expected
+
+
+def test_symbol_disk_cache_round_trips_as_json(client):
+    client._save_symbols_to_disk(SYMBOLS)
+
+    cache_path = client._symbol_disk_cache_path()
+    assert cache_path.endswith(".json")
+    assert os.stat(os.path.dirname(cache_path)).st_mode & 0o777 == 0o700
+    assert os.stat(cache_path).st_mode & 0o777 == 0o600
+    assert client._load_symbols_from_disk() == SYMBOLS
+
+
+def test_symbol_disk_cache_ignores_file_writable_by_others(client):
+    client._save_symbols_to_disk(SYMBOLS)
+    os.chmod(client._symbol_disk_cache_path(), 0o666)
+
+    assert client._load_symbols_from_disk() is None
+
+
+def test_symbol_disk_cache_expires(client):
+    client._save_symbols_to_disk(SYMBOLS)
+    stale = time.time() - binance_futures_client._SYMBOL_DISK_CACHE_TTL - 1
+    os.utime(client._symbol_disk_cache_path(), (stale, stale))
+
+    assert client._load_symbols_from_disk() is None
+
+
+def test_symbol_disk_cache_skips_ownership_check_without_getuid(client, monkeypatch):
+    client._save_symbols_to_disk(SYMBOLS)
+    os.chmod(client._symbol_disk_cache_path(), 0o666)  # how Windows reports a writable file
+    monkeypatch.delattr(binance_futures_client.os, "getuid")
+
+    assert client._load_symbols_from_disk() == SYMBOLS
+
+def test_concurrent_ahead_of_server_errors_nudge_offset_once(client, monkeypatch):
+    client._host.time_offset = 0
+    rejected = threading.Barrier(2)
+    attempts = threading.local()
+
+    def do_request(method, url, weight):
+        if getattr(attempts, "count", 0) == 0:
+            attempts.count = 1
+            rejected.wait(5)  # both requests were signed with the same offset
+            raise binance_futures_client._TimestampError(
+                "Binance API error [-1021]: Timestamp for this request was 1000ms ahead of the server's time."
+            )
+        return {}
+
+    monkeypatch.setattr(client, "_do_request", do_request)
+    threads = [threading.Thread(target=client._request_signed, args=("GET", "/fapi/v2/account")) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert client.time_offset == -binance_futures_client._TIME_NUDGE_MS
+
+
+
+def test_periodic_sync_keeps_the_nudge(client, monkeypatch):
+    local_ms = 1_700_000_000_000
+    monkeypatch.setattr(binance_futures_client.time, "time_ns", lambda: local_ms * 1_000_000)
+    monkeypatch.setattr(client, "http", FakeTimeHttp(local_ms + 200))
+
+    _sync_time(client)
+    assert client.time_offset == 200
+
+    client._recover_from_timestamp_error(
+        binance_futures_client._TimestampError("Timestamp for this request was 1000ms ahead of the server's time."),
+        client._host.time_generation,
+        first_attempt=True,
+    )
+    assert client.time_offset == 200 - binance_futures_client._TIME_NUDGE_MS
+
+    _sync_time(client)
+    assert client.time_offset == 200 - binance_futures_client._TIME_NUDGE_MS
+
+    # A rejection the nudge can't explain starts over from a fresh measurement
+    client._sync_time = lambda: _sync_time(client)
+    client._recover_from_timestamp_error(
+        binance_futures_client._TimestampError("Timestamp for this request is outside of the recvWindow."),
+        client._host.time_generation,
+        first_attempt=False,
+    )
+    assert client.time_offset == 200
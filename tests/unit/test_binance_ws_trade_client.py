@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src import binance_futures_client, binance_ws_trade_client
+from src.binance_futures_client import BinanceFuturesClient
+from src.binance_ws_trade_client import BinanceWSTradeClient, WSTradeUnavailableError
+
+
+@pytest.fixture
+def ws_client(monkeypatch):
+    monkeypatch.setattr(BinanceFuturesClient, "_sync_time", lambda self: None)
+    monkeypatch.setattr(BinanceFuturesClient, "_start_time_sync_thread", lambda self: None)
+    rest_client = BinanceFuturesClient("api-key", "api-secret", base_url="https://testnet.binancefuture.com")
+    return BinanceWSTradeClient(rest_client, ws_url="wss://test.invalid/ws-fapi/v1")
+
+
+def test_send_signed_fails_fast_and_reconnects_in_background(ws_client, monkeypatch):
+    connect_started = threading.Event()
+    release_connect = threading.Event()
+
+    def slow_create_connection(*args, **kwargs):
+        connect_started.set()
+        release_connect.wait(5)
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(binance_ws_trade_client.websocket, "create_connection", slow_create_connection)
+
+    # Raises straight away even though the connect attempt is still blocked
+    with pytest.raises(WSTradeUnavailableError):
+        ws_client._send_signed("order.place", {"symbol": "BTCUSDT"})
+    assert connect_started.wait(5)
+
+    # A second order while the reconnect is in flight doesn't start another
+    reconnect_thread = ws_client.reconnect_thread
+    with pytest.raises(WSTradeUnavailableError):
+        ws_client._send_signed("order.place", {"symbol": "BTCUSDT"})
+    assert ws_client.reconnect_thread is reconnect_thread
+
+    release_connect.set()
+    reconnect_thread.join(5)
+    assert not reconnect_thread.is_alive()
+    assert not ws_client.connected
+
+
+class FakeWebSocket:
+    def __init__(self, frames=()):
+        self.connected = True
+        self.frames = list(frames)
+        self.pings = 0
+
+    def recv_data(self, control_frame=False):
+        frame = self.frames.pop(0) if self.frames else None
+        if frame is not None:
+            return frame
+        raise binance_ws_trade_client.websocket.WebSocketTimeoutException("timed out")
+
+    def ping(self):
+        self.pings += 1
+
+    def close(self):
+        self.connected = False
+
+
+def test_read_loop_closes_connection_that_never_answers_ping(ws_client):
+    ws = FakeWebSocket()
+    ws_client.ws = ws
+
+    ws_client._read_loop(ws)
+
+    assert ws.pings == 1
+    assert not ws_client.connected
+
+
+def test_read_loop_keeps_connection_that_answers_ping(ws_client):
+    # Times out and pings, gets the pong, then stays silent: pinged again before closing
+    ws = FakeWebSocket([None, (binance_ws_trade_client.websocket.ABNF.OPCODE_PONG, b"")])
+    ws_client.ws = ws
+
+    ws_client._read_loop(ws)
+
+    assert ws.pings == 2
+
+
+def test_send_signed_retries_after_timestamp_rejection(ws_client, monkeypatch):
+    ws_client.ws = FakeWebSocket()
+    ws_client.rest_client._host.time_offset = 0
+    sent = []
+
+    def send_signed_once(method, params):
+        sent.append(method)
+        if len(sent) == 1:
+            raise binance_ws_trade_client._TimestampError(
+                "Binance API error [-1021]: Timestamp for this request was 1000ms ahead of the server's time."
+            )
+        return {"orderId": 1}
+
+    monkeypatch.setattr(ws_client, "_send_signed_once", send_signed_once)
+
+    assert ws_client._send_signed("order.place", {"symbol": "BTCUSDT"}) == {"orderId": 1}
+    assert len(sent) == 2
+    assert ws_client.rest_client.time_offset == -binance_futures_client._TIME_NUDGE_MS
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src import config_loader
+
+
+CONFIG_YAML = """
+base_url: https://testnet.binancefuture.com
+master:
+  api_key: master-key
+  api_secret: master-secret
+followers:
+  - name: follower1
+    api_key: follower-key
+    api_secret: follower-secret
+    scale: 0.5
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return path
+
+
+def test_load_config_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        config_loader.load_config(str(tmp_path / "missing.yaml"))
+
+
+def test_load_config_fills_section_defaults(config_file):
+    config = config_loader.load_config(str(config_file))
+    assert config.followers[0].enabled is True
+    assert config.trading.follower_order_type == "MARKET"
+    assert config.trading.symbol_leverage == {}
+    assert config.websocket.keepalive_interval == 1800
+
+
+def test_load_config_missing_required_field(config_file):
+    config_file.write_text(CONFIG_YAML.replace("base_url", "url"), encoding="utf-8")
+    with pytest.raises(ValueError):
+        config_loader.load_config(str(config_file))
+
+
+@pytest.fixture(params=["msgspec", "fields"])
+def parse_path(request, monkeypatch):
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(config_loader, "msgspec", None)
+    return request.param
+
+
+def test_load_config_example_on_both_parse_paths(parse_path):
+    example = Path(__file__).resolve().parents[2] / "config.example.yaml"
+    config = config_loader.load_config(str(example))
+
+    fallback = config_loader._parse_config_fields(yaml.safe_load(example.read_text(encoding="utf-8")))
+    assert config == fallback
+
+
+def test_load_config_lenient_values_on_both_parse_paths(config_file, parse_path):
+    config_file.write_text(
+        CONFIG_YAML.replace("scale: 0.5", "scale: 2\n    note: unknown keys are ignored")
+        + "trading:\n  min_order_quantity: '0.01'\n",
+        encoding="utf-8",
+    )
+    config = config_loader.load_config(str(config_file))
+
+    assert float(config.followers[0].scale) == 2.0
+    assert float(config.trading.min_order_quantity) == 0.01
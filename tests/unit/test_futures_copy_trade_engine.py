@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import queue
+from decimal import Decimal
+
+import pytest
+
+from src import binance_futures_client
+from src import futures_copy_trade_engine as engine_module
+from src.binance_futures_client import BinanceFuturesClient
+from src.config_loader import Config, FollowerConfig, MasterConfig
+
+
+def order_trade_update(execution_type: str = "TRADE", status: str = "FILLED", trade_id: int = 7) -> bytes:
+    """An ORDER_TRADE_UPDATE frame as Binance sends it (compact JSON, raw bytes)."""
+    return (
+        b'{"e":"ORDER_TRADE_UPDATE","T":1700000000000,"E":1700000000001,"o":{'
+        b'"s":"BTCUSDT","c":"web_1","S":"BUY","o":"MARKET","f":"GTC","q":"0.010","p":"0",'
+        b'"ap":"30000","sp":"0","x":"' + execution_type.encode() + b'","X":"' + status.encode() + b'",'
+        b'"i":123456,"l":"0.010","z":"0.010","L":"30000.5","N":"USDT","n":"0.1",'
+        b'"T":1700000000000,"t":' + str(trade_id).encode() + b',"b":"0","a":"0","m":false,'
+        b'"R":false,"wt":"CONTRACT_PRICE","ot":"MARKET","ps":"BOTH","cp":false,"rp":"0"}}'
+    )
+
+
+class FakeTradeLogger:
+    def __init__(self, *args, **kwargs):
+        self.records = []
+
+    def log_master_trade(self, **kwargs):
+        self.records.append(("master", kwargs))
+
+    def log_follower_trade(self, **kwargs):
+        self.records.append(("follower", kwargs))
+
+    def log_error(self, *args):
+        self.records.append(("error", args))
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(BinanceFuturesClient, "_sync_time", lambda self: None)
+    monkeypatch.setattr(BinanceFuturesClient, "_start_time_sync_thread", lambda self: None)
+    monkeypatch.setattr(engine_module, "TradeLogger", FakeTradeLogger)
+
+    config = Config(
+        base_url="https://testnet.binancefuture.com",
+        master=MasterConfig(api_key="master-key", api_secret="master-secret"),
+        followers=[FollowerConfig(name="follower1", api_key="follower-key", api_secret="follower-secret")],
+    )
+    config.websocket.order_api_enabled = False
+
+    engine = engine_module.FuturesCopyTradeEngine(config)
+    yield engine
+    engine.order_executor.shutdown(wait=False)
+
+
+@pytest.fixture
+def follower(engine, monkeypatch):
+    follower = engine._active_followers[0]
+    filters = {
+        "PRICE_FILTER": {"filterType": "PRICE_FILTER", "tickSize": "0.10", "minPrice": "556.80", "maxPrice": "4529764"},
+        "LOT_SIZE": {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001", "maxQty": "1000"},
+        "MIN_NOTIONAL": {"filterType": "MIN_NOTIONAL", "notional": "100"},
+    }
+    monkeypatch.setattr(binance_futures_client, "_symbol_precision_cache", {})
+    monkeypatch.setattr(binance_futures_client, "_symbol_filters_cache", {(follower.client.base_url, "BTCUSDT"): filters})
+    monkeypatch.setattr(follower.client, "get_balance", lambda asset="USDT": Decimal("100000"))
+    return follower
+
+
+def queued_orders(engine):
+    orders = []
+    for event_queue in engine.event_queues:
+        while True:
+            try:
+                orders.append(event_queue.get_nowait())
+            except queue.Empty:
+                break
+    return orders
+
+
+def test_on_message_queues_bytes_order_trade_update(engine):
+    engine._on_message(None, order_trade_update())
+
+    orders = queued_orders(engine)
+    assert len(orders) == 1
+    assert orders[0]["s"] == "BTCUSDT"
+    assert orders[0]["t"] == 7
+
+
+@pytest.mark.parametrize("execution_type, status", [("NEW", "NEW"), ("CANCELED", "CANCELED"), ("EXPIRED", "EXPIRED")])
+def test_on_message_drops_non_trade_order_updates_before_decoding(engine, monkeypatch, execution_type, status):
+    def fail_decode(message):
+        raise AssertionError("non-TRADE order updates should be dropped before decoding")
+
+    monkeypatch.setattr(engine_module, "_json_loads", fail_decode)
+    engine._on_message(None, order_trade_update(execution_type, status))
+
+    assert queued_orders(engine) == []
+
+
+def test_on_message_queues_partial_trade_order_update(engine):
+    engine._on_message(None, order_trade_update("TRADE", "PARTIALLY_FILLED"))
+
+    orders = queued_orders(engine)
+    assert [(order["x"], order["X"]) for order in orders] == [("TRADE", "PARTIALLY_FILLED")]
+
+
+def test_on_message_ignores_other_events(engine):
+    engine._on_message(None, b'{"e":"ACCOUNT_UPDATE","E":1700000000001,"a":{"m":"ORDER","B":[],"P":[]}}')
+
+    assert queued_orders(engine) == []
+
+
+def test_place_follower_batch_rounds_orders_and_drops_invalid_ones(engine, follower, monkeypatch):
+    batches = []
+
+    def place_batch_orders(orders):
+        batches.append(orders)
+        return [{"orderId": 1, "status": "NEW", "executedQty": "0"}]
+
+    monkeypatch.setattr(follower.client, "place_batch_orders", place_batch_orders)
+    orders = [
+        engine_module._Fill("BTCUSDT", "BUY", 0.0123456, 30000.0, "BOTH"),
+        engine_module._Fill("BTCUSDT", "BUY", 0.0004, 30000.0, "BOTH"),  # below minQty
+        engine_module._Fill("BTCUSDT", "SELL", 0.002, 30000.0, "BOTH"),  # below MIN_NOTIONAL
+    ]
+    engine._place_follower_batch(follower, orders, {"BTCUSDT": 30000.0})
+
+    assert [[order["quantity"] for order in batch] for batch in batches] == [["0.012"]]
+    stats = engine.get_statistics()
+    assert stats["successful_copies"] == 1
+    assert stats["failed_copies"] == 2
+    assert stats["min_notional_rejected"] == 1
+    assert [record[1][2] for record in engine.trade_logger.records if record[0] == "error"] == ["validation"]
+
+
+def test_place_follower_batch_records_per_order_errors_separately(engine, follower, monkeypatch):
+    monkeypatch.setattr(follower.client, "place_batch_orders", lambda orders: [
+        {"orderId": 1, "status": "NEW", "executedQty": "0"},
+        {"code": -2019, "msg": "Margin is insufficient."},
+    ])
+    orders = [
+        engine_module._Fill("BTCUSDT", "BUY", 0.01, 30000.0, "BOTH"),
+        engine_module._Fill("BTCUSDT", "SELL", 0.02, 30000.0, "BOTH"),
+    ]
+    engine._place_follower_batch(follower, orders, {"BTCUSDT": 30000.0})
+
+    stats = engine.get_statistics()
+    assert stats["successful_copies"] == 1
+    assert stats["failed_copies"] == 1
+    kinds = [record[0] for record in engine.trade_logger.records]
+    assert kinds == ["follower", "error"]
+
+
+def test_reconnect_delay_grows_across_repeated_closes(engine, monkeypatch):
+    delays = []
+
+    def record_wait(timeout=None):
+        delays.append(timeout)
+        return False
+
+    engine.is_running = True
+    monkeypatch.setattr(engine_module.random, "uniform", lambda low, high: 1.0)
+    monkeypatch.setattr(engine.stop_event, "wait", record_wait)
+    monkeypatch.setattr(engine.master_client, "create_listen_key", lambda: "listen-key")
+    # The socket connects but closes again before _on_open ever runs
+    monkeypatch.setattr(engine, "_connect_websocket", lambda: None)
+
+    for _ in range(6):
+        engine._on_close(None, 1006, "abnormal closure")
+
+    assert delays == [5, 10, 20, 40, 60, 60]
+
+    engine._on_open(None)
+    engine._on_close(None, 1006, "abnormal closure")
+    assert delays[-1] == 5
+
+
+def test_group_by_distinct_symbol_keeps_same_symbol_fills_in_separate_batches():
+    fills = [
+        engine_module._Fill("BTCUSDT", "BUY", 0.01, 30000.0, "BOTH"),
+        engine_module._Fill("ETHUSDT", "BUY", 0.1, 2000.0, "BOTH"),
+        engine_module._Fill("BTCUSDT", "SELL", 0.01, 30010.0, "BOTH"),
+        engine_module._Fill("SOLUSDT", "BUY", 1.0, 100.0, "BOTH"),
+    ]
+
+    groups = engine_module.FuturesCopyTradeEngine._group_by_distinct_symbol(fills)
+
+    assert [[fill.symbol for fill in group] for group in groups] == [
+        ["BTCUSDT", "ETHUSDT"],
+        ["BTCUSDT", "SOLUSDT"],
+    ]
+
+
+def test_event_worker_replicates_same_symbol_fills_in_order(engine, monkeypatch):
+    replicated = []
+    monkeypatch.setattr(engine, "_replicate_to_followers", lambda fills: replicated.append([f.side for f in fills]))
+
+    event_queue = engine.event_queues[0]
+    for trade_id, side in ((1, "BUY"), (2, "SELL")):
+        order = engine_module._json_loads(order_trade_update(trade_id=trade_id))["o"]
+        order["S"] = side
+        event_queue.put(order)
+    event_queue.put(None)
+    engine._event_worker_loop(0)
+
+    assert replicated == [["BUY"], ["SELL"]]
+
+
+@pytest.fixture
+def startable_engine(engine, monkeypatch):
+    monkeypatch.setattr(engine, "_initialize_accounts", lambda: None)
+    monkeypatch.setattr(engine.master_client, "prime_symbol_cache", lambda: None)
+    monkeypatch.setattr(engine, "_warm_up_followers", lambda: None)
+    monkeypatch.setattr(engine.master_client, "create_listen_key", lambda: "listen-key")
+    monkeypatch.setattr(engine.master_client, "close_listen_key", lambda listen_key: None)
+    monkeypatch.setattr(engine, "_connect_websocket", lambda: None)
+    return engine
+
+
+def test_engine_restarts_after_stop(startable_engine):
+    startable_engine.start()
+    startable_engine.stop()
+    startable_engine.start()
+
+    assert startable_engine.is_running
+    assert all(worker.is_alive() for worker in startable_engine.event_workers)
+    assert startable_engine.order_executor.submit(lambda: 42).result(timeout=5) == 42
+    startable_engine.stop()
+
+
+def test_failed_start_stops_event_workers(startable_engine, monkeypatch):
+    def fail_listen_key():
+        raise ConnectionError("listen key unavailable")
+
+    monkeypatch.setattr(startable_engine.master_client, "create_listen_key", fail_listen_key)
+    started = []
+    original_thread = engine_module.Thread
+
+    def recording_thread(*args, **kwargs):
+        thread = original_thread(*args, **kwargs)
+        started.append(thread)
+        return thread
+
+    monkeypatch.setattr(engine_module, "Thread", recording_thread)
+
+    with pytest.raises(ConnectionError):
+        startable_engine.start()
+
+    assert started and not any(thread.is_alive() for thread in started)
+    assert not startable_engine.is_running
+
+
+def test_should_log_traceback_once_per_interval_and_expires_old_kinds(engine, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(engine_module.time, "monotonic", lambda: now[0])
+
+    assert engine._should_log_traceback(ValueError("bad: 1"))
+    assert not engine._should_log_traceback(ValueError("bad: 2"))
+
+    now[0] += engine_module._TRACEBACK_LOG_INTERVAL
+    assert engine._should_log_traceback(KeyError("other"))
+    assert list(engine._traceback_logged_at) == [("KeyError", "'other'")]
+    assert engine._should_log_traceback(ValueError("bad: 3"))
+
+
+def test_should_log_traceback_caps_remembered_kinds(engine, monkeypatch):
+    monkeypatch.setattr(engine_module, "_MAX_TRACEBACK_KEYS", 3)
+
+    for symbol in ("A", "B", "C", "D", "E"):
+        assert engine._should_log_traceback(RuntimeError(symbol))
+
+    assert [key[1] for key in engine._traceback_logged_at] == ["C", "D", "E"]
@@ -8,6 +8,11 @@ from typing import Any, Dict, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader  # libyaml C implementation
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 CONFIG_FILENAME = Path("config.yaml")
 CONFIG_EXAMPLE_FILENAME = Path("config.example.yaml")
@@ -48,7 +53,7 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
         raise FileNotFoundError(str(path))
     
     with open(path, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+        data = yaml.load(fh, Loader=_YamlLoader) or {}
     
     if not isinstance(data, dict):
         raise ConfigError(f"Configuration file {path} must contain a mapping object")
@@ -142,9 +147,10 @@ def update_config(config: Dict[str, Any]) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(
+        yaml.dump(
             config,
             fh,
+            Dumper=_YamlDumper,
             sort_keys=False,
             allow_unicode=True,
             default_flow_style=False